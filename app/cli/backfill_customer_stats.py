@@ -0,0 +1,52 @@
+"""Recompute the order aggregates stored on every customer.
+
+Usage:
+    python -m app.cli.backfill_customer_stats --batch-size 5000
+
+Customers are processed in id order, one transaction per batch, so the
+orders table is only locked against writes for one batch at a time and the
+command can be resumed with --after-id. On a database created before the
+aggregate columns existed, run ``python -m app.cli.migrate_schema`` first.
+"""
+import argparse
+import asyncio
+import time
+
+from app.config.firebase import AsyncSessionLocal, engine, init_db
+from app.services.customer_stats_service import CustomerStatsService
+
+
+async def backfill(batch_size: int = 5000, after_id: str = None) -> int:
+    """Rebuild aggregates for customers with id greater than after_id"""
+    await init_db()
+    total = 0
+    started = time.perf_counter()
+    while True:
+        async with AsyncSessionLocal() as session:
+            ids = await CustomerStatsService.backfill_batch(session, after_id, batch_size)
+            await session.commit()
+        if not ids:
+            break
+        after_id = ids[-1]
+        total += len(ids)
+        print(f"  {total:,} customers rebuilt, last id {after_id}", end="\r")
+    print(f"Rebuilt {total:,} customer aggregates in {time.perf_counter() - started:.1f}s" + " " * 40)
+    return total
+
+
+async def _main(args) -> None:
+    try:
+        await backfill(args.batch_size, args.after_id)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill customer order aggregates")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Customers updated per transaction")
+    parser.add_argument("--after-id", default=None, help="Resume after this customer id")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
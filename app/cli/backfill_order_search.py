@@ -0,0 +1,52 @@
+"""Rebuild the full-text search document of every order.
+
+Usage:
+    python -m app.cli.backfill_order_search --batch-size 5000
+
+Orders are processed in id order, one transaction per batch, so the
+command can be interrupted and resumed with --after-id. On a database
+created before orders had a search document, run
+``python -m app.cli.migrate_schema`` first.
+"""
+import argparse
+import asyncio
+import time
+
+from app.config.firebase import AsyncSessionLocal, engine, init_db
+from app.services.order_search_service import OrderSearchService
+
+
+async def backfill(batch_size: int = 5000, after_id: str = None) -> int:
+    """Rebuild search documents for orders with id greater than after_id"""
+    await init_db()
+    total = 0
+    started = time.perf_counter()
+    while True:
+        async with AsyncSessionLocal() as session:
+            ids = await OrderSearchService.backfill_batch(session, after_id, batch_size)
+            await session.commit()
+        if not ids:
+            break
+        after_id = ids[-1]
+        total += len(ids)
+        print(f"  {total:,} orders indexed, last id {after_id}", end="\r")
+    print(f"Rebuilt {total:,} search documents in {time.perf_counter() - started:.1f}s" + " " * 40)
+    return total
+
+
+async def _main(args) -> None:
+    try:
+        await backfill(args.batch_size, args.after_id)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill order search documents")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Orders updated per transaction")
+    parser.add_argument("--after-id", default=None, help="Resume after this order id")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
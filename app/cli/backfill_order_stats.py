@@ -0,0 +1,65 @@
+"""Rebuild the order_daily_stats rollup from the orders table.
+
+Usage:
+    python -m app.cli.backfill_order_stats
+    python -m app.cli.backfill_order_stats --start 2024-01-01 --end 2024-12-31 --chunk-days 7
+
+Days are rebuilt in chunks, each in its own transaction, so the orders
+table is only locked against writes for one chunk at a time.
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, datetime, timedelta
+
+from app.config.firebase import AsyncSessionLocal, engine, init_db
+from app.services.order_stats_service import OrderStatsService
+
+
+def _parse_day(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+async def backfill(start: date = None, end: date = None, chunk_days: int = 31) -> int:
+    """Rebuild rollup rows for [start, end]; defaults to the full order history"""
+    await init_db()
+    if start is None or end is None:
+        async with AsyncSessionLocal() as session:
+            bounds = await OrderStatsService.order_date_range(session)
+        if bounds is None:
+            print("No orders to backfill")
+            return 0
+        start = start or bounds[0]
+        end = end or bounds[1]
+
+    total = 0
+    started = time.perf_counter()
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days), end + timedelta(days=1))
+        async with AsyncSessionLocal() as session:
+            total += await OrderStatsService.rebuild(session, chunk_start, chunk_end)
+            await session.commit()
+        print(f"  {chunk_start} .. {chunk_end - timedelta(days=1)}: {total:,} rollup rows", end="\r")
+        chunk_start = chunk_end
+    print(f"Rebuilt {total:,} rollup rows for {start} .. {end} in {time.perf_counter() - started:.1f}s" + " " * 20)
+    return total
+
+
+async def _main(args) -> None:
+    try:
+        await backfill(args.start, args.end, args.chunk_days)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill the order_daily_stats rollup")
+    parser.add_argument("--start", type=_parse_day, default=None, help="First day (YYYY-MM-DD), default first order")
+    parser.add_argument("--end", type=_parse_day, default=None, help="Last day (YYYY-MM-DD), default last order")
+    parser.add_argument("--chunk-days", type=int, default=31, help="Days rebuilt per transaction")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
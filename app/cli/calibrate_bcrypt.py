@@ -0,0 +1,27 @@
+"""Measure bcrypt on this host and print the recommended work factor.
+
+Usage:
+    python -m app.cli.calibrate_bcrypt --target-ms 250
+
+Run it once on the production host type and set the printed BCRYPT_ROUNDS
+in the environment, so every worker hashes at the same cost.
+"""
+import argparse
+
+from app.config.settings import settings
+from app.utils.passwords import MAX_BCRYPT_ROUNDS, MIN_BCRYPT_ROUNDS, calibrate_bcrypt_rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibrate the bcrypt work factor")
+    parser.add_argument("--target-ms", type=float, default=settings.BCRYPT_TARGET_VERIFY_MS, help="Target verify latency in milliseconds")
+    parser.add_argument("--min-rounds", type=int, default=MIN_BCRYPT_ROUNDS)
+    parser.add_argument("--max-rounds", type=int, default=MAX_BCRYPT_ROUNDS)
+    args = parser.parse_args()
+
+    rounds = calibrate_bcrypt_rounds(args.target_ms, args.min_rounds, args.max_rounds)
+    print(f"BCRYPT_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Send queued notifications from the outbox table.
+
+Usage:
+    python -m app.cli.dispatch_outbox
+    python -m app.cli.dispatch_outbox --concurrency 16 --once
+
+Runs apart from the web workers. Each round claims a batch of due messages
+with FOR UPDATE SKIP LOCKED, so any number of dispatchers can run side by
+side, sends them in parallel and records sent, retry-later or failed.
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+from app.config.firebase import AsyncSessionLocal, engine, init_db
+from app.config.logging_config import setup_logging
+from app.config.settings import settings
+from app.services.notification_service import NotificationService
+from app.services.outbox_service import OutboxService
+
+logger = logging.getLogger(__name__)
+
+
+async def _send(message, semaphore: asyncio.Semaphore) -> tuple:
+    async with semaphore:
+        try:
+            delivered = await asyncio.to_thread(
+                NotificationService.deliver, message.channel, message.template, message.payload
+            )
+            error = None if delivered else "Provider reported a failed delivery"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    if error:
+        logger.warning("Outbox message %s (%s.%s) attempt %s failed: %s",
+                       message.id, message.channel, message.template, message.attempts, error)
+    return message, error
+
+
+async def dispatch_batch(batch_size: int, concurrency: int) -> int:
+    """Claim, send and record one batch; returns the number of messages claimed"""
+    async with AsyncSessionLocal() as session:
+        messages = await OutboxService.claim(session, batch_size, settings.OUTBOX_LEASE_SECONDS)
+        await session.commit()
+    if not messages:
+        return 0
+
+    semaphore = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(*(_send(message, semaphore) for message in messages))
+
+    async with AsyncSessionLocal() as session:
+        await OutboxService.record_results(session, results, settings.OUTBOX_MAX_ATTEMPTS)
+        await session.commit()
+    return len(messages)
+
+
+async def run(batch_size: int, concurrency: int, poll_seconds: float, once: bool) -> int:
+    """Dispatch until stopped, or until nothing is due when once is set"""
+    await init_db()
+    total = 0
+    started = time.perf_counter()
+    while True:
+        claimed = await dispatch_batch(batch_size, concurrency)
+        total += claimed
+        if claimed:
+            logger.info("Dispatched %s outbox messages (%s total)", claimed, total)
+        elif once:
+            break
+        else:
+            await asyncio.sleep(poll_seconds)
+    print(f"Processed {total:,} outbox messages in {time.perf_counter() - started:.1f}s")
+    return total
+
+
+async def _main(args) -> None:
+    try:
+        await run(args.batch_size, args.concurrency, args.poll_seconds, args.once)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Send queued email and SMS notifications")
+    parser.add_argument("--batch-size", type=int, default=settings.OUTBOX_BATCH_SIZE, help="Messages claimed per round")
+    parser.add_argument("--concurrency", type=int, default=settings.OUTBOX_CONCURRENCY, help="Parallel sends")
+    parser.add_argument("--poll-seconds", type=float, default=settings.OUTBOX_POLL_SECONDS, help="Sleep when nothing is due")
+    parser.add_argument("--once", action="store_true", help="Exit once no message is due")
+    setup_logging()
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
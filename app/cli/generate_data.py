@@ -0,0 +1,245 @@
+"""Fill the database with realistic, referentially consistent synthetic data.
+
+Usage:
+    python -m app.cli.generate_data --orders 2000000 --customers 50000 --years 5
+    python -m app.cli.generate_data --orders 100000 --status-mix "pending=0.2,completed=0.7,cancelled=0.1"
+
+Rows are streamed in batches through asyncpg COPY (``--method copy``) or
+multi-row INSERT executemany (``--method insert``); the ORM is never used,
+so memory stays flat regardless of row counts. Run the backfill commands
+afterwards for derived data (``python -m app.cli.backfill_order_stats``,
+``python -m app.cli.backfill_order_search`` and
+``python -m app.cli.backfill_customer_stats``).
+"""
+import argparse
+import asyncio
+import math
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator
+
+import bcrypt
+from sqlalchemy import insert, text
+
+from app.config.firebase import Base, engine
+from app.models.postgress_model import (
+    Contact, Customer, Expense, ExpenseType, News, Order, OrderStatus,
+    Payment, PaymentStatus, PaymentType, Service, Student, StudentStatus
+)
+
+FIRST_NAMES = ["Kwame", "Ama", "Kofi", "Akosua", "Yaw", "Abena", "Kojo", "Efua", "Kwabena", "Adwoa", "John", "Mary"]
+LAST_NAMES = ["Mensah", "Owusu", "Boateng", "Asante", "Osei", "Appiah", "Agyeman", "Darko", "Addo", "Ofori"]
+PRODUCTS = ["shirts", "caps", "mugs", "banners", "hoodies", "tote bags", "uniforms", "jerseys", "flyers", "stickers"]
+FINISHES = ["Embroidered", "Screen printed", "Heat pressed", "Branded", "Custom", "Sublimated"]
+COLORS = ["black", "white", "navy", "red", "green", "yellow", "grey", None]
+SERVICE_TITLES = [
+    "Embroidery", "Screen Printing", "Heat Transfer", "Sublimation", "Large Format Printing",
+    "Corporate Branding", "Uniform Production", "Promotional Items", "Graphic Design", "Signage"
+]
+DEFAULT_STATUS_MIX = "pending=0.08,in_progress=0.12,completed=0.7,cancelled=0.1"
+# SQLAlchemy stores Enum columns by member name
+ENUM_LABEL = {status: status.name for status in OrderStatus}
+
+
+def _parse_mix(value: str) -> tuple[list[OrderStatus], list[float]]:
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        weights[OrderStatus(name.strip())] = float(weight)
+    return list(weights), list(weights.values())
+
+
+class DateSampler:
+    """Sample datetimes in [start, end] with yearly seasonality and growth
+
+    ``seasonality`` is the relative amplitude of a yearly cycle peaking in
+    ``peak_month``; ``growth`` is the yearly volume growth rate.
+    """
+
+    def __init__(self, rng: random.Random, start: datetime, end: datetime,
+                 seasonality: float, peak_month: int, growth: float):
+        self.rng = rng
+        self.start = start
+        self.span = (end - start).total_seconds()
+        self.seasonality = seasonality
+        self.peak_month = peak_month
+        self.growth = growth
+        self.years = max(self.span / (365.25 * 86400), 1e-9)
+        self.max_weight = (1 + seasonality) * (1 + growth) ** self.years
+
+    def _weight(self, moment: datetime, offset: float) -> float:
+        phase = 2 * math.pi * (moment.month - self.peak_month) / 12
+        seasonal = 1 + self.seasonality * math.cos(phase)
+        trend = (1 + self.growth) ** (offset / (365.25 * 86400))
+        return seasonal * trend
+
+    def sample(self) -> datetime:
+        while True:
+            offset = self.rng.uniform(0, self.span)
+            moment = self.start + timedelta(seconds=offset)
+            if self.rng.uniform(0, self.max_weight) <= self._weight(moment, offset):
+                return moment.replace(microsecond=0)
+
+
+async def _write(conn, method: str, table, columns: list[str], rows: list[tuple]) -> None:
+    if not rows:
+        return
+    if method == "copy":
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(table.name, records=rows, columns=columns)
+    else:
+        await conn.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+        await conn.commit()
+
+
+async def _load(conn, method: str, model, columns: list[str], rows: Iterable[tuple], batch_size: int) -> int:
+    table = model.__table__
+    total = 0
+    started = time.perf_counter()
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            await _write(conn, method, table, columns, batch)
+            total += len(batch)
+            batch = []
+            print(f"  {table.name}: {total:,} rows ({total / (time.perf_counter() - started):,.0f}/s)", end="\r")
+    await _write(conn, method, table, columns, batch)
+    total += len(batch)
+    print(f"  {table.name}: {total:,} rows in {time.perf_counter() - started:.1f}s" + " " * 20)
+    return total
+
+
+def _person(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+async def generate(args) -> None:
+    rng = random.Random(args.seed)
+    end = datetime.utcnow().replace(microsecond=0)
+    start = end - timedelta(days=int(365.25 * args.years))
+    dates = DateSampler(rng, start, end, args.seasonality, args.peak_month, args.growth)
+    statuses, status_weights = _parse_mix(args.status_mix)
+    run = uuid.uuid4().hex[:6]
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if args.truncate:
+            await conn.execute(text(
+                "TRUNCATE outbox, payments, students, order_daily_stats, orders, customers, services, expenses, news, contacts CASCADE"
+            ))
+
+    service_ids = [str(uuid.uuid4()) for _ in range(args.services)]
+    customer_ids = [str(uuid.uuid4()) for _ in range(args.customers)]
+    student_ids = [str(uuid.uuid4()) for _ in range(args.students)]
+
+    def services() -> Iterator[tuple]:
+        for i, service_id in enumerate(service_ids):
+            created = dates.sample()
+            title = SERVICE_TITLES[i % len(SERVICE_TITLES)] + (f" {i // len(SERVICE_TITLES) + 1}" if i >= len(SERVICE_TITLES) else "")
+            yield (service_id, title, f"{title} services", "pi pi-box", None, True, created, created)
+
+    def customers() -> Iterator[tuple]:
+        for i, customer_id in enumerate(customer_ids):
+            created = dates.sample()
+            yield (customer_id, _person(rng), f"customer.{run}.{i}@example.com",
+                   f"+23320{rng.randint(0, 9999999):07d}", f"{rng.randint(1, 200)} Ring Road, Accra", created, created)
+
+    def orders() -> Iterator[tuple]:
+        for i in range(args.orders):
+            created = dates.sample()
+            status = rng.choices(statuses, status_weights)[0]
+            quantity = rng.randint(1, 250)
+            unit_price = round(rng.lognormvariate(2.5, 0.8), 2)
+            updated = min(created + timedelta(days=rng.randint(0, 21)), end)
+            yield (str(uuid.uuid4()), f"ORD-{created:%Y%m%d}-G{run}{i:08d}", rng.choice(customer_ids),
+                   rng.choice(service_ids), f"{rng.choice(FINISHES)} {rng.choice(PRODUCTS)}",
+                   round(quantity * unit_price, 2), quantity, rng.choice(COLORS), unit_price,
+                   ENUM_LABEL[status], None, created, updated)
+
+    def expenses() -> Iterator[tuple]:
+        types = list(ExpenseType)
+        for _ in range(args.expenses):
+            day = dates.sample()
+            yield (str(uuid.uuid4()), day, round(rng.lognormvariate(5, 1.2), 2), rng.choice(types).name,
+                   "Generated expense", day, day)
+
+    def news() -> Iterator[tuple]:
+        for i in range(args.news):
+            from_date = dates.sample()
+            to_date = from_date + timedelta(days=rng.randint(3, 120))
+            yield (str(uuid.uuid4()), f"Announcement {i}", "Generated news content", rng.random() < 0.8,
+                   from_date, to_date, from_date, from_date)
+
+    def students() -> Iterator[tuple]:
+        student_statuses = list(StudentStatus)
+        # One low-cost hash shared by every generated account (password "password")
+        password_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(4)).decode("utf-8")
+        for i, student_id in enumerate(student_ids):
+            created = dates.sample()
+            yield (student_id, f"student.{run}.{i}@example.com", password_hash, True, _person(rng),
+                   f"+23324{rng.randint(0, 9999999):07d}", rng.choice(student_statuses).name, created, created)
+
+    def payments() -> Iterator[tuple]:
+        payment_types = list(PaymentType)
+        payment_statuses = [PaymentStatus.SUCCESS, PaymentStatus.PENDING, PaymentStatus.FAILED, PaymentStatus.CANCELLED]
+        for i in range(args.payments if student_ids else 0):
+            created = dates.sample()
+            status = rng.choices(payment_statuses, [70, 15, 10, 5])[0]
+            yield (str(uuid.uuid4()), rng.choice(student_ids), f"gen-{run}-{i}", round(rng.uniform(200, 5000), 2),
+                   rng.choice(payment_types).name, status.name,
+                   created + timedelta(minutes=5) if status == PaymentStatus.SUCCESS else None, created, created)
+
+    def contacts() -> Iterator[tuple]:
+        for i in range(args.contacts):
+            created = dates.sample()
+            yield (str(uuid.uuid4()), _person(rng), f"contact.{run}.{i}@example.com", None,
+                   rng.random() < 0.6, "Generated enquiry", created)
+
+    plan = [
+        (Service, ["id", "title", "description", "icon", "image_url", "is_active", "created_at", "updated_at"], services()),
+        (Customer, ["id", "name", "email", "phone", "address", "created_at", "updated_at"], customers()),
+        (Order, ["id", "order_number", "customer_id", "service_id", "description", "amount", "quantity",
+                 "color", "unit_price", "status", "progress_notes", "created_at", "updated_at"], orders()),
+        (Expense, ["id", "date", "amount", "type", "description", "created_at", "updated_at"], expenses()),
+        (News, ["id", "title", "content", "active", "from_date", "to_date", "created_at", "updated_at"], news()),
+        (Student, ["id", "email", "password_hash", "is_active", "full_name", "phone", "status",
+                   "created_at", "updated_at"], students()),
+        (Payment, ["id", "student_id", "payment_reference", "amount", "payment_type", "status",
+                   "verified_at", "created_at", "updated_at"], payments()),
+        (Contact, ["id", "name", "email", "phone", "is_read", "message", "created_at"], contacts()),
+    ]
+
+    async with engine.connect() as conn:
+        for model, columns, rows in plan:
+            await _load(conn, args.method, model, columns, rows, args.batch_size)
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic data for load testing")
+    parser.add_argument("--services", type=int, default=20)
+    parser.add_argument("--customers", type=int, default=20000)
+    parser.add_argument("--orders", type=int, default=1000000)
+    parser.add_argument("--expenses", type=int, default=50000)
+    parser.add_argument("--news", type=int, default=500)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--payments", type=int, default=20000)
+    parser.add_argument("--contacts", type=int, default=10000)
+    parser.add_argument("--years", type=float, default=3, help="History length ending now")
+    parser.add_argument("--status-mix", default=DEFAULT_STATUS_MIX, help="Order status weights, e.g. " + DEFAULT_STATUS_MIX)
+    parser.add_argument("--seasonality", type=float, default=0.35, help="Yearly cycle amplitude (0 disables)")
+    parser.add_argument("--peak-month", type=int, default=12, help="Busiest month of the year")
+    parser.add_argument("--growth", type=float, default=0.15, help="Yearly volume growth rate")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--method", choices=["copy", "insert"], default="copy")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible data")
+    parser.add_argument("--truncate", action="store_true", help="Empty the application tables first")
+    asyncio.run(generate(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
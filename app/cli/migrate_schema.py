@@ -0,0 +1,122 @@
+"""Add columns and indexes declared on the models to an existing database.
+
+Usage:
+    python -m app.cli.migrate_schema --dry-run
+    python -m app.cli.migrate_schema
+
+create_all (run by init_db on startup) only creates missing tables, so a
+database created before a model gained a column or index needs this once
+per deploy, before the new code serves traffic. Columns are added one short
+transaction at a time under a lock timeout; indexes are built with
+CREATE INDEX CONCURRENTLY so writes are not blocked while they build. A
+concurrent build that failed leaves an invalid index behind, which is
+dropped and rebuilt. Columns that are NOT NULL without a server default
+cannot be added to tables with rows and are reported instead; add those
+by hand.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn, CreateIndex
+
+from app.config.firebase import Base, engine, init_db
+from app.models import postgress_model  # noqa: F401 - registers the tables on Base.metadata
+
+# How long one ALTER TABLE may wait for its lock before giving up
+LOCK_TIMEOUT = "5s"
+
+
+def _plan(sync_conn) -> dict:
+    """Columns to add, columns that cannot be added, and indexes to build"""
+    inspector = inspect(sync_conn)
+    existing_tables = set(inspector.get_table_names())
+    invalid = set(sync_conn.execute(text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid"
+    )).scalars())
+    plan = {"columns": [], "unsupported": [], "indexes": [], "invalid": []}
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in columns:
+                continue
+            if column.nullable or column.server_default is not None:
+                plan["columns"].append(column)
+            else:
+                plan["unsupported"].append(column)
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in invalid:
+                plan["invalid"].append(index)
+            elif index.name not in indexes:
+                plan["indexes"].append(index)
+    return plan
+
+
+def _create_index_sql(index, dialect) -> str:
+    options = index.dialect_options["postgresql"]
+    options["concurrently"] = True
+    try:
+        return str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect))
+    finally:
+        options["concurrently"] = False
+
+
+async def migrate(dry_run: bool = False) -> int:
+    """Apply pending column and index changes; returns the number of unsupported columns"""
+    await init_db()
+    async with engine.connect() as conn:
+        plan = await conn.run_sync(_plan)
+    dialect = engine.dialect
+
+    for column in plan["unsupported"]:
+        print(f"Cannot add {column.table.name}.{column.name}: NOT NULL without a server default")
+
+    started = time.perf_counter()
+    for column in plan["columns"]:
+        definition = CreateColumn(column).compile(dialect=dialect)
+        statement = f'ALTER TABLE "{column.table.name}" ADD COLUMN IF NOT EXISTS {definition}'
+        print(statement)
+        if not dry_run:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+                await conn.execute(text(statement))
+
+    # CONCURRENTLY cannot run inside a transaction block
+    autocommit = engine.execution_options(isolation_level="AUTOCOMMIT")
+    statements = [f'DROP INDEX CONCURRENTLY IF EXISTS "{index.name}"' for index in plan["invalid"]]
+    statements += [_create_index_sql(index, dialect) for index in plan["invalid"] + plan["indexes"]]
+    for statement in statements:
+        print(statement)
+        if not dry_run:
+            async with autocommit.connect() as conn:
+                await conn.execute(text(statement))
+
+    if not (plan["columns"] or statements):
+        print("Schema is up to date")
+    elif not dry_run:
+        print(f"Applied {len(plan['columns']) + len(statements)} changes in {time.perf_counter() - started:.1f}s")
+    return len(plan["unsupported"])
+
+
+async def _main(args) -> int:
+    try:
+        return await migrate(args.dry_run)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Add model columns and indexes missing from the database")
+    parser.add_argument("--dry-run", action="store_true", help="Print the statements without running them")
+    unsupported = asyncio.run(_main(parser.parse_args()))
+    sys.exit(1 if unsupported else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import re
+import time
+from collections import Counter as ShapeCounter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+from app.utils.metrics import registry
+
+STATEMENTS = registry.counter(
+    "db_statements_total", "SQL statements executed", ("operation",)
+)
+STATEMENT_LATENCY = registry.histogram(
+    "db_statement_duration_seconds", "SQL statement latency", ("operation",)
+)
+
+_IN_LIST = re.compile(r"\(\s*\$\d+(?:\s*,\s*\$\d+)*\s*\)")
+_PARAM = re.compile(r"\$\d+|%\([^)]+\)s|\?")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so executions differing only in parameters match"""
+    shape = _IN_LIST.sub("(?)", statement)
+    shape = _PARAM.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """Statements and database time accumulated while serving one request"""
+
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: ShapeCounter = ShapeCounter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.seconds += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def most_repeated(self) -> tuple[Optional[str], int]:
+        """Return the most repeated statement shape and its count"""
+        if not self.shapes:
+            return None, 0
+        return self.shapes.most_common(1)[0]
+
+
+# Stats of the request being served, set by QueryStatsMiddleware
+query_stats_var: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _operation(statement: str) -> str:
+    return statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    elapsed = time.perf_counter() - started
+    operation = _operation(statement)
+    STATEMENTS.inc(operation)
+    STATEMENT_LATENCY.observe(elapsed, operation)
+    stats = query_stats_var.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # Keep the timing stack balanced when a statement fails
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine) -> None:
+    """Attach statement timing listeners to an (async) engine"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
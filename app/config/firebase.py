@@ -3,6 +3,7 @@ from firebase_admin import credentials, firestore, auth
 from app.config.settings import settings
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from app.config.db_instrumentation import instrument_engine
 import logging
 
 # Create async engine
@@ -15,6 +16,7 @@ engine = create_async_engine(
     max_overflow=10,
     echo=False
 )
+instrument_engine(engine)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -36,6 +38,16 @@ async def get_db():
         finally:
             await session.close()
 
+def in_own_session(compute):
+    """Wrap compute(session) to run on a new session
+
+    For work that may outlive the request, such as shared cache computations.
+    """
+    async def run():
+        async with AsyncSessionLocal() as session:
+            return await compute(session)
+    return run
+
 # Initialize database tables
 async def init_db():
     async with engine.begin() as conn:
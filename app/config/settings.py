@@ -34,7 +34,52 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    # Authorize from verified token claims instead of loading the user
+    AUTH_CLAIMS_MODE: bool = False
+
+    # Principal cache for get_current_user
+    PRINCIPAL_CACHE_MAXSIZE: int = 1024
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+
+    # Dashboard statistics cache; 0 disables caching but keeps request coalescing
+    STATS_CACHE_MAXSIZE: int = 256
+    STATS_CACHE_TTL_SECONDS: int = 30
+
+    # Password hashing pool ("thread" or "process")
+    PASSWORD_HASHER_EXECUTOR: str = "thread"
+    PASSWORD_HASHER_WORKERS: int = 4
+    # bcrypt work factor; pin the value printed by python -m app.cli.calibrate_bcrypt
+    # so every worker hashes at the same cost
+    BCRYPT_ROUNDS: int = 12
+    # Verify latency targeted by app.cli.calibrate_bcrypt
+    BCRYPT_TARGET_VERIFY_MS: int = 250
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = True
+    LOG_LEVELS: str = ""  # Per-logger levels, e.g. "sqlalchemy.engine=WARNING,app.services=DEBUG"
+    LOG_SAMPLING: str = ""  # Per-logger keep rate for sub-WARNING records, e.g. "uvicorn.access=0.1"
+
+    # Flag requests that repeat one statement shape more than this many times
+    DB_N_PLUS_ONE_THRESHOLD: int = 5
+    # Return per-request X-DB-* query stats headers; keep off in production
+    QUERY_STATS_HEADERS: bool = False
+
+    # Serve order statistics from the order_daily_stats rollup. Writes keep the
+    # rollup current either way, but nothing backfills it on startup: run
+    # `python -m app.cli.backfill_order_stats` once before enabling on existing data
+    ORDER_STATS_FROM_ROLLUP: bool = False
+
+    # Notification outbox dispatcher (`python -m app.cli.dispatch_outbox`)
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_CONCURRENCY: int = 8
+    OUTBOX_POLL_SECONDS: float = 2.0
+    OUTBOX_LEASE_SECONDS: int = 300  # Claimed messages reappear after this if a dispatcher dies
+    OUTBOX_MAX_ATTEMPTS: int = 8
+    OUTBOX_BACKOFF_SECONDS: int = 30  # Doubles per failed attempt
+    OUTBOX_MAX_BACKOFF_SECONDS: int = 3600
+
     # Twilio
     TWILIO_ACCOUNT_SID: Optional[str] = None
     TWILIO_AUTH_TOKEN: Optional[str] = None
@@ -7,6 +7,7 @@ from .contact_controller import router as contact_router
 from .expenses_controller import expense_router as expense_router
 from .new_controller import news_router as news_router
 from .student_controller import student_router as student_router
+from .dashboard_controller import router as dashboard_router
 
 __all__ = [
     "auth_router",
@@ -17,5 +18,6 @@ __all__ = [
     "contact_router",
     "expense_router",
     "news_router",
-    "student_router"
+    "student_router",
+    "dashboard_router"
 ]
\ No newline at end of file
@@ -1,17 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserLogin, Token
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from typing import List, Optional
+from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserLogin, Token, RefreshRequest
 from app.services.auth_service import AuthService
-from app.utils.helpers import create_access_token
+from app.services.refresh_token_service import RefreshTokenService
 from app.middleware.auth_middleware import get_current_user, require_admin, require_super_admin
 from app.config.firebase import get_db
+from app.utils.pagination import created_at_key, set_next_cursor
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """Register a new user (Public endpoint for initial setup, should be protected in production)"""
     auth_service = AuthService()
-    print("Registering user:", user)
     return await auth_service.create_user(db, user)
 
 @router.post("/login", response_model=Token)
@@ -27,8 +27,22 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    access_token = create_access_token(data={"sub": (str(user.id))})
-    return Token(access_token=access_token, token_type="bearer")
+    access_token = auth_service.create_user_access_token(user)
+    refresh_token = await RefreshTokenService.create(db, user.id)
+    return Token(access_token=access_token, token_type="bearer", refresh_token=refresh_token)
+
+@router.post("/refresh", response_model=Token)
+async def refresh(request: RefreshRequest, db: AsyncSession = Depends(get_db)):
+    """Exchange a refresh token for a new access/refresh token pair"""
+    user, refresh_token = await RefreshTokenService.rotate(db, request.refresh_token)
+    access_token = AuthService.create_user_access_token(user)
+    return Token(access_token=access_token, token_type="bearer", refresh_token=refresh_token)
+
+@router.post("/logout")
+async def logout(request: RefreshRequest, db: AsyncSession = Depends(get_db)):
+    """Revoke a refresh token and every token rotated from it"""
+    await RefreshTokenService.revoke(db, request.refresh_token)
+    return {"message": "Logged out successfully"}
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info( db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)):
@@ -38,15 +52,19 @@ async def get_current_user_info( db: AsyncSession = Depends(get_db), current_use
 
 @router.get("/users",  response_model=List[UserResponse],)
 async def list_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     search: str = None,
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     # current_user: dict = Depends(require_admin)
 ):
     """List all users (Admin only)"""
     auth_service = AuthService()
-    return await auth_service.list_users(db, skip=skip, limit=limit, search=search)
+    users = await auth_service.list_users(db, skip=skip, limit=limit, search=search, cursor=cursor)
+    set_next_cursor(response, users, limit, created_at_key)
+    return users
 
 @router.post("/users", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
@@ -55,7 +73,6 @@ async def create_user(
     current_user: dict = Depends(require_super_admin)
 ):
     """Create a new user with specific role (Super Admin only)"""
-    print("Creating user:", user)
     auth_service = AuthService()
     return await auth_service.create_user(db, user)
 
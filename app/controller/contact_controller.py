@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, status, BackgroundTasks
-from typing import List
+from fastapi import APIRouter, Depends, Query, Response, status
+from typing import List, Optional
 from app.schemas.contact import ContactCreate, ContactResponse, MessageSend
 from app.services.contact_service import ContactService
 from app.services.customer_service import CustomerService
@@ -7,49 +7,38 @@ from app.services.sms_service import SMSService
 from app.services.email_service import EmailService
 from app.middleware.auth_middleware import require_admin, get_optional_user
 from app.config.firebase import get_db
+from app.utils.pagination import created_at_key, set_next_cursor
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 router = APIRouter(prefix="/api/contacts", tags=["Contact"])
 
-async def notify_admin_contact(contact: ContactResponse):
-    """Background task to notify admin about new contact"""
-    sms_service = SMSService()
-    email_service = EmailService()
-    
-    await sms_service.notify_admin_contact_form(contact.name, contact.email)
-    await email_service.notify_admin_contact_form(
-        contact.name,
-        contact.email,
-        contact.message,
-        contact.phone
-    )
-
 @router.post("", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def submit_contact_form(
     contact: ContactCreate,
-    background_tasks: BackgroundTasks,
      db: AsyncSession = Depends(get_db),
 ):
     """Submit contact form (Public endpoint)"""
     contact_service = ContactService()
    
-    new_contact = await contact_service.create_contact(db, contact)
-    
-    # Notify admin in background
-    background_tasks.add_task(notify_admin_contact, new_contact)
-    
-    return new_contact
+    # Admin alerts are queued in the outbox with the contact
+    return await contact_service.create_contact(db, contact)
 
 @router.get("", response_model=List[ContactResponse])
 async def list_contacts(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     unread_only: bool = False,
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
      db: AsyncSession = Depends(get_db),
     # current_user: dict = Depends(require_admin)
 ):
     """List all contact submissions (Admin only)"""
     contact_service = ContactService()
-    return await contact_service.list_contacts(db, skip=skip, limit=limit, unread_only=unread_only)
+    contacts = await contact_service.list_contacts(
+        db, skip=skip, limit=limit, unread_only=unread_only, cursor=cursor
+    )
+    set_next_cursor(response, contacts, limit, created_at_key)
+    return contacts
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def get_contact(
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from typing import List, Optional
 from app.schemas.customer import CustomerCreate, CustomerUpdate, CustomerResponse
-from app.services.customer_service import CustomerService
+from app.services.customer_service import CUSTOMER_SORTS, CustomerService, customer_sort_key
 from app.middleware.auth_middleware import require_admin
 from app.config.firebase import get_db
+from app.utils.pagination import set_next_cursor
 from sqlalchemy.ext.asyncio import  AsyncSession
 router = APIRouter(prefix="/api/customers", tags=["Customers"])
 
@@ -19,15 +20,22 @@ async def create_customer(
 
 @router.get("", response_model=List[CustomerResponse])
 async def list_customers(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    sort: str = Query("created_at", enum=list(CUSTOMER_SORTS), description="Largest first, e.g. lifetime_revenue for top customers"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """List all customers with search (Admin only)"""
     customer_service = CustomerService()
-    return await customer_service.list_customers(db, skip=skip, limit=limit, search=search)
+    customers = await customer_service.list_customers(
+        db, skip=skip, limit=limit, search=search, cursor=cursor, sort=sort
+    )
+    set_next_cursor(response, customers, limit, customer_sort_key(sort))
+    return customers
 
 @router.get("/{customer_id}", response_model=CustomerResponse)
 async def get_customer(
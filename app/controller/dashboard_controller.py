@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from app.middleware.auth_middleware import require_super_admin
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
+
+@router.get("/summary")
+async def get_dashboard_summary(
+    current_user: dict = Depends(require_super_admin),
+    period: Optional[str] = Query(None, enum=["today", "week", "month", "year", "all"], description="Order statistics period")
+):
+    """
+    Get every admin dashboard section in one call (Admin only)
+    
+    Order statistics, expense totals, payment revenue, unread contacts and
+    current news are computed concurrently on separate database sessions.
+    `timings_ms` holds each section's time and the total; a failed section
+    is null in `sections` with its message in `errors`.
+    """
+    return await DashboardService.get_summary(period)
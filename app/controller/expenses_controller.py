@@ -1,11 +1,13 @@
 from datetime import datetime
 from typing import List, Optional
-from app.config.firebase import get_db
-from fastapi import APIRouter, Depends, status, BackgroundTasks, Query
+from app.config.firebase import get_db, in_own_session
+from fastapi import APIRouter, Depends, Response, status, BackgroundTasks, Query
 from app.middleware.auth_middleware import require_admin
 from app.models.postgress_model import ExpenseType
 from app.schemas.expenses import ExpenseCreate, ExpenseResponse, ExpenseUpdate
 from app.services.expenses import ExpenseService
+from app.utils.cache import stats_cache
+from app.utils.pagination import set_next_cursor
 from sqlalchemy.ext.asyncio import  AsyncSession
 expense_router = APIRouter(prefix="/expenses", tags=["Expenses"])
 
@@ -29,11 +31,13 @@ async def get_expense(
 
 @expense_router.get("/", response_model=List[ExpenseResponse])
 async def get_expenses(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     type: Optional[ExpenseType] = None,
     start_date: Optional[str] = Query(None, description="Format: YYYY-MM-DD"),
     end_date: Optional[str] = Query(None, description="Format: YYYY-MM-DD"),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
@@ -41,9 +45,11 @@ async def get_expenses(
     parsed_start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
     parsed_end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
     
-    return await ExpenseService.get_expenses(
-        db, skip, limit, type, parsed_start, parsed_end
+    expenses = await ExpenseService.get_expenses(
+        db, skip, limit, type, parsed_start, parsed_end, cursor
     )
+    set_next_cursor(response, expenses, limit, lambda e: (e.date or e.created_at, e.id))
+    return expenses
 
 @expense_router.put("/{expense_id}", response_model=ExpenseResponse)
 async def update_expense(
@@ -70,13 +76,14 @@ async def get_expense_statistics(
     month: Optional[int] = Query(None, ge=1, le=12),
     start_date: Optional[str] = Query(None, description="Format: YYYY-MM-DD"),
     end_date: Optional[str] = Query(None, description="Format: YYYY-MM-DD"),
-    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """Get expense statistics (Admin only)"""
     parsed_start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
     parsed_end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
     
-    return await ExpenseService.get_expense_statistics(
-        db, year, month, parsed_start, parsed_end
+    params = {"year": year, "month": month, "start_date": parsed_start, "end_date": parsed_end}
+    return await stats_cache.get_or_compute(
+        "expenses.statistics", params, ("expenses",),
+        in_own_session(lambda db: ExpenseService.get_expense_statistics(db, **params))
     )
@@ -2,11 +2,12 @@
 from fastapi import APIRouter, Depends, Query,status, BackgroundTasks
 from typing import List, Optional
 
-from app.config.firebase import get_db
+from app.config.firebase import get_db, in_own_session
 from app.middleware.auth_middleware import require_admin
 from sqlalchemy.ext.asyncio import  AsyncSession
 from app.schemas.news import NewsCreate, NewsResponse, NewsUpdate
 from app.services.news_service import NewsService
+from app.utils.cache import stats_cache
 
 news_router = APIRouter(prefix="/news", tags=["News"])
 
@@ -68,9 +69,11 @@ async def toggle_news_active(
 
 @news_router.get("/statistics/summary")
 async def get_news_statistics(
-    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """Get news statistics (Admin only)"""
-    return await NewsService.get_news_statistics(db)
+    return await stats_cache.get_or_compute(
+        "news.statistics", {}, ("news",),
+        in_own_session(NewsService.get_news_statistics)
+    )
 
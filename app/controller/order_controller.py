@@ -1,94 +1,54 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List, Optional
 
 from fastapi.params import Query
-from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse
+from app.schemas.order import (
+    ORDER_LIST_ADAPTER, OrderCreate, OrderBulkCreate, OrderBulkStatusUpdate, OrderUpdate, OrderResponse,
+    OrderSearchResult
+)
 from app.services.order_service import OrderService
-from app.services.customer_service import CustomerService
-from app.services.sms_service import SMSService
-from app.services.email_service import EmailService
+from app.services.order_search_service import OrderSearchService
+from app.services.order_export_service import EXPORT_MEDIA_TYPES, OrderExportService
 from app.middleware.auth_middleware import require_admin, require_super_admin
 from app.models.order import OrderStatus
-from app.config.firebase import get_db
+from app.config.firebase import get_db, in_own_session
+from app.utils.cache import stats_cache
+from app.utils.pagination import created_at_key, set_next_cursor
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import  AsyncSession
 router = APIRouter(prefix="/api/orders", tags=["Orders"])
 
-async def send_order_notifications(
-    order: OrderResponse,
-    customer,
-    is_new: bool = False,
-    status_changed: bool = False
-):
-    """Background task to send order notifications"""
-    sms_service = SMSService()
-    email_service = EmailService()
-    
-    if is_new:
-        # Notify admin about new order
-        # await sms_service.notify_admin_new_order(order.order_number, customer.name)
-        # await email_service.notify_admin_new_order(
-        #     order.order_number,
-        #     order.customer.name,
-        #     order.customer.email,
-        #     order.service,
-        #     order.amount,
-        #     order.customer.phone
-        # )
-        
-        # Send confirmation to customer
-        await email_service.send_order_confirmation(
-            order.customer.email,
-            order.order_number,
-            order.customer.name,
-            order.service.title,
-            order.amount
-        )
-        await sms_service.send_order_notification(
-            order.customer.phone,
-            order.order_number,
-            order.status.value
-        )
-    
-    if status_changed:
-        # Send update to customer
-        await sms_service.send_order_notification(
-            order.customer.phone,
-            order.order_number,
-            order.status.value
-        )
-        await email_service.send_order_update(
-            order.customer.email,
-            order.order_number,
-            order.customer.name,
-            order.status.value,
-            order.progress_notes
-        )
-
 @router.post("", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
 async def create_order(
     order: OrderCreate,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """Create a new order (Admin only)"""
 
     order_service = OrderService()
-    customer_service = CustomerService()
-    
-    new_order = await order_service.create_order(db, order)
-    customer = await customer_service.get_customer(db, order.customer_id)
     
-    # Send notifications in background
-    background_tasks.add_task(
-        send_order_notifications,
-        new_order,
-        customer,
-        is_new=True
-    )
-    
-    return new_order
+    # Notifications are queued in the outbox with the order
+    return await order_service.create_order(db, order)
+
+@router.post("/bulk", response_model=List[OrderResponse], status_code=status.HTTP_201_CREATED)
+async def create_orders_bulk(
+    payload: OrderBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_admin)
+):
+    """Create up to 1000 orders in one request, e.g. from a spreadsheet import (Admin only)"""
+    return await OrderService.create_orders_bulk(db, payload.orders)
+
+@router.patch("/status", response_model=List[OrderResponse])
+async def update_orders_status(
+    payload: OrderBulkStatusUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_admin)
+):
+    """Move up to 1000 orders to one status, e.g. completing the day's work (Admin only)"""
+    return await OrderService.update_orders_status(db, payload)
 
 @router.get("", response_model=List[OrderResponse])
 async def list_orders(
@@ -97,22 +57,54 @@ async def list_orders(
     status: Optional[OrderStatus] = None,
     customer_id: Optional[str] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """List all orders with filters (Admin only)"""
     order_service = OrderService()
-    return await order_service.list_orders(db,
+    orders = await order_service.list_orders(db,
         skip=skip,
         limit=limit,
         status=status,
         customer_id=customer_id,
-        search=search
+        search=search,
+        cursor=cursor
     )
+    # Already validated by the service; serialize directly instead of re-validating
+    response = Response(content=ORDER_LIST_ADAPTER.dump_json(orders), media_type="application/json")
+    set_next_cursor(response, orders, limit, created_at_key)
+    return response
+
+@router.get("/export")
+async def export_orders(
+    format: str = Query("csv", enum=["csv", "ndjson"]),
+    status: Optional[OrderStatus] = None,
+    customer_id: Optional[str] = None,
+    search: Optional[str] = None,
+    current_user: dict = Depends(require_admin)
+):
+    """Stream every matching order as CSV or NDJSON (Admin only)"""
+    filename = f"orders-{datetime.utcnow():%Y%m%d-%H%M%S}.{format}"
+    return StreamingResponse(
+        OrderExportService.export_orders(format, status=status, customer_id=customer_id, search=search),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.get("/search", response_model=List[OrderSearchResult])
+async def search_orders(
+    q: str = Query(..., min_length=1, description='Words, "quoted phrases" or -excluded words'),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_admin)
+):
+    """Search orders by number, description, customer and service, best matches first (Admin only)"""
+    return await OrderSearchService.search(db, q, skip=skip, limit=limit)
 
 @router.get("/statistics")
 async def get_order_statistics(
-    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_super_admin),
     period: Optional[str] = Query(None, enum=["today", "week", "month", "year", "all"]),
     year: Optional[int] = Query(None, ge=2000, le=2100),
@@ -145,15 +137,45 @@ async def get_order_statistics(
     if end_date:
         parsed_end_date = datetime.strptime(end_date, "%Y-%m-%d")
     
-    return await order_service.get_order_statistics(
-        db=db,
-        period=period,
-        year=year,
-        month=month,
-        start_date=parsed_start_date,
-        end_date=parsed_end_date,
-        include_monthly_breakdown=include_monthly_breakdown,
-        include_comparison=include_comparison
+    params = {
+        "period": period,
+        "year": year,
+        "month": month,
+        "start_date": parsed_start_date,
+        "end_date": parsed_end_date,
+        "include_monthly_breakdown": include_monthly_breakdown,
+        "include_comparison": include_comparison
+    }
+    return await stats_cache.get_or_compute(
+        "orders.statistics", params, ("orders",),
+        in_own_session(lambda db: order_service.get_order_statistics(db=db, **params))
+    )
+
+@router.get("/timeseries")
+async def get_order_timeseries(
+    current_user: dict = Depends(require_super_admin),
+    granularity: str = Query("month", enum=["day", "week", "month", "quarter"]),
+    start_date: Optional[str] = Query(None, description="Format: YYYY-MM-DD, defaults to one year before end_date"),
+    end_date: Optional[str] = Query(None, description="Format: YYYY-MM-DD, defaults to today")
+):
+    """
+    Get order counts and revenue per time bucket (Admin only)
+    
+    Every bucket in the range is returned, empty ones as zeros. Values come
+    back as column arrays aligned with `buckets`; `revenue` is completed
+    order revenue and `by_status` holds per-status counts and amounts.
+    """
+    parsed_start_date = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else None
+    parsed_end_date = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else None
+    
+    params = {
+        "granularity": granularity,
+        "start_date": parsed_start_date,
+        "end_date": parsed_end_date
+    }
+    return await stats_cache.get_or_compute(
+        "orders.timeseries", params, ("orders",),
+        in_own_session(lambda db: OrderService.get_order_timeseries(db, **params))
     )
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -170,29 +192,14 @@ async def get_order(
 async def update_order(
     order_id: str,
     order: OrderUpdate,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """Update order (Admin only)"""
     order_service = OrderService()
-    customer_service = CustomerService()
-    
-    # Get old order to check if status changed
-    old_order = await order_service.get_order(db, order_id)
-    updated_order = await order_service.update_order(db, order_id, order)
-    
-    # If status changed, send notifications
-    if order.status and old_order.status != updated_order.status:
-        customer = await customer_service.get_customer(db,updated_order.customer_id)
-        background_tasks.add_task(
-            send_order_notifications,
-            updated_order,
-            customer,
-            status_changed=True
-        )
     
-    return updated_order
+    # A status change queues the customer's notifications in the same transaction
+    return await order_service.update_order(db, order_id, order)
 
 @router.delete("/{order_id}")
 async def delete_order(
@@ -1,11 +1,11 @@
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from fastapi.responses import HTMLResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.firebase import get_db
+from app.config.firebase import get_db, in_own_session
 from app.middleware.auth_middleware import require_admin
 from app.models.postgress_model import Payment, PaymentType, PaymentStatus
 from app.schemas.payments import (
@@ -15,6 +15,8 @@ from app.schemas.payments import (
     PaymentResponse
 )
 from app.services.payment_service import PaymentService
+from app.utils.cache import stats_cache
+from app.utils.pagination import created_at_key, set_next_cursor
 from app.controller.student_controller import get_current_student
 
 payment_router = APIRouter(prefix="/payments", tags=["Payments"])
@@ -99,25 +101,31 @@ async def payment_callback(
 
 @payment_router.get("/", response_model=List[PaymentResponse])
 async def get_all_payments(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status_filter: Optional[PaymentStatus] = None,
     payment_type_filter: Optional[PaymentType] = None,
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """Get all payments (Admin only)"""
-    return await PaymentService.get_all_payments(
-        db, skip, limit, status_filter, payment_type_filter
+    payments = await PaymentService.get_all_payments(
+        db, skip, limit, status_filter, payment_type_filter, cursor
     )
+    set_next_cursor(response, payments, limit, created_at_key)
+    return payments
 
 @payment_router.get("/statistics")
 async def get_payment_statistics(
-    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """Get payment statistics (Admin only)"""
-    return await PaymentService.get_payment_statistics(db)
+    return await stats_cache.get_or_compute(
+        "payments.statistics", {}, ("payments",),
+        in_own_session(PaymentService.get_payment_statistics)
+    )
 
 @payment_router.get("/{payment_id}", response_model=PaymentResponse)
 async def get_payment_by_id(
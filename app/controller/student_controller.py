@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status, Query, HTTPException
+from fastapi import APIRouter, Depends, Response, status, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 
@@ -18,6 +18,7 @@ from app.schemas.student import (
 )
 from app.services.student_service import StudentService
 from app.utils.helpers import create_access_token
+from app.utils.pagination import created_at_key, set_next_cursor
 
 # JWT Configuration (adjust these based on your existing auth setup)
 SECRET_KEY = "your-secret-key-here"  # Use environment variable in production
@@ -138,17 +139,21 @@ async def update_admission_form(
 
 @student_router.get("/", response_model=List[StudentResponse])
 async def get_all_students(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status_filter: Optional[StudentStatus] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_admin)
 ):
     """Get all students with optional filters (Admin only)"""
-    return await StudentService.get_students(
-        db, skip, limit, status_filter, search
+    students = await StudentService.get_students(
+        db, skip, limit, status_filter, search, cursor
     )
+    set_next_cursor(response, students, limit, created_at_key)
+    return students
 
 @student_router.get("/statistics")
 async def get_admission_statistics(
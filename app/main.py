@@ -10,13 +10,27 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from starlette.requests import Request
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware import Middleware
+from app.config.logging_config import setup_logging
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.metrics_middleware import MetricsMiddleware
+from app.middleware.query_stats_middleware import QueryStatsMiddleware
+from app.utils.metrics import registry
+from fastapi.responses import PlainTextResponse
+import logging
+
+setup_logging()
+logger = logging.getLogger(__name__)
 
 middleware = [
+    Middleware(RequestContextMiddleware),
+    Middleware(MetricsMiddleware),
+    Middleware(QueryStatsMiddleware),
     Middleware(
         CORSMiddleware,
         allow_origins=['*'],
         allow_methods=['*'],
-        allow_headers=['*']
+        allow_headers=['*'],
+        expose_headers=['X-Next-Cursor', 'X-Request-ID']
     )
 ]
 
@@ -27,6 +41,7 @@ app.add_middleware(
     allow_origins=['*'],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Request-ID"],
 )
 
 @app.exception_handler(RequestValidationError)
@@ -51,10 +66,16 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "InnoTrend API"}
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Prometheus metrics"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path, exc_info=exc)
     return JSONResponse(
         status_code=500,
         content={
@@ -68,17 +89,19 @@ async def global_exception_handler(request, exc):
 async def startup_event():
     """Startup event"""
     await init_db()
-    print("✅ Database tables created/verified")
+    logger.info("Database tables created/verified")
 
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event"""
-    print("Shutting down InnoTrend API...")
+    logger.info("Shutting down InnoTrend API...")
+    password_hasher.shutdown()
 
 from app.config.firebase import init_db
-from app.controller import auth_controller, contact_controller, order_controller,  employee_controller, customer_controller,service_controller,new_controller, expenses_controller
+from app.utils.passwords import password_hasher
+from app.controller import auth_controller, contact_controller, order_controller,  employee_controller, customer_controller,service_controller,new_controller, expenses_controller, dashboard_controller
 
 app.include_router(auth_controller.router)
 app.include_router(contact_controller.router)
@@ -88,4 +111,5 @@ app.include_router(customer_controller.router)
 app.include_router(service_controller.router)
 app.include_router(new_controller.news_router)
 app.include_router(expenses_controller.expense_router)
+app.include_router(dashboard_controller.router)
 
@@ -3,11 +3,48 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 from app.config.firebase import get_db
 from app.utils.helpers import decode_token
+from app.utils.cache import principal_cache, token_versions
+from app.config.settings import settings
 from app.services.auth_service import AuthService
 from app.models.user import UserRole
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import logging
+
+logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
+async def _principal_from_claims(db: AsyncSession, user_id: str, payload: dict) -> dict:
+    """Build principal from verified token claims
+
+    Only the user's token version is read from the database, and it is
+    cached for the principal cache TTL.
+    """
+    stored = token_versions.get(user_id)
+    if stored is None:
+        stored = await AuthService.get_token_version(db, user_id)
+        if stored is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        token_versions.set(user_id, stored)
+    
+    if not token_versions.is_current(payload.get("ver", 0), stored):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return {
+        "id": user_id,
+        "email": payload.get("email"),
+        "full_name": payload.get("name"),
+        "role": payload["role"],
+        "is_active": bool(payload.get("active", False))
+    }
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
@@ -17,7 +54,7 @@ async def get_current_user(
     payload = decode_token(token)
     
     if payload is None:
-        print("Token payload is None")
+        logger.debug("Rejected request with invalid token")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
@@ -32,29 +69,39 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    auth_service = AuthService()
-    user = await auth_service.get_user_by_id(db, user_id)
+    if settings.AUTH_CLAIMS_MODE and "role" in payload:
+        principal = await _principal_from_claims(db, user_id, payload)
+    else:
+        principal = principal_cache.get(user_id)
     
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    if principal is None:
+        auth_service = AuthService()
+        user = await auth_service.get_user_by_id(db, user_id)
+        
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
+        principal = {
+            "id": user.id,
+            "email": user.email,
+            "full_name": user.full_name,
+            "role": user.role,
+            "is_active": user.is_active
+        }
+        principal_cache.set(user_id, principal)
     
-    if not user.is_active:
+    if not principal["is_active"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user"
         )
     
-    return {
-        "id": user.id,
-        "email": user.email,
-        "full_name": user.full_name,
-        "role": user.role,
-        "is_active": user.is_active
-    }
+    # Hand out a copy so callers cannot mutate the cached entry
+    return dict(principal)
 
 async def get_current_active_user(
     current_user: dict = Depends(get_current_user)
@@ -66,7 +113,6 @@ async def require_admin(
     current_user: dict = Depends(get_current_user)
 ) -> dict:
     """Require admin or manager role"""
-    print("Current user role:", current_user["role"])
     if current_user["role"] not in [UserRole.ADMIN, UserRole.MANAGER]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
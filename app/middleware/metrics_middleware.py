@@ -0,0 +1,66 @@
+import time
+
+from app.utils.metrics import DEFAULT_SIZE_BUCKETS, registry
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")
+)
+RESPONSE_SIZE = registry.histogram(
+    "http_response_size_bytes", "HTTP response body size by route template", ("method", "route"),
+    buckets=DEFAULT_SIZE_BUCKETS
+)
+IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served", ("method",)
+)
+
+
+def route_template(scope) -> str:
+    """Return the matched route path template (e.g. /api/orders/{order_id})
+
+    Raw paths are never used as labels so cardinality stays bounded.
+    """
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    return getattr(route, "path_format", None) or getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """Record per-route latency, status, response size and in-flight counts"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_with_metrics(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        IN_FLIGHT.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec(method)
+            route = route_template(scope)
+            REQUESTS.inc(method, route, str(status_code))
+            LATENCY.observe(elapsed, method, route)
+            RESPONSE_SIZE.observe(response_size, method, route)
@@ -0,0 +1,70 @@
+import logging
+
+from app.config.db_instrumentation import QueryStats, query_stats_var
+from app.config.settings import settings
+from app.middleware.metrics_middleware import route_template
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request", "SQL statements issued per request", ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+)
+DB_TIME_PER_REQUEST = registry.histogram(
+    "db_time_per_request_seconds", "Database time spent per request", ("route",)
+)
+N_PLUS_ONE = registry.counter(
+    "db_n_plus_one_requests_total", "Requests repeating one statement shape above the threshold", ("route",)
+)
+
+
+class QueryStatsMiddleware:
+    """Count statements and database time per request and flag N+1 patterns
+
+    With QUERY_STATS_HEADERS set the numbers are also returned as X-DB-*
+    response headers. Statements issued after the response starts
+    (background tasks) are included in metrics but not in the headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = query_stats_var.set(stats)
+        threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and settings.QUERY_STATS_HEADERS:
+                _, repeats = stats.most_repeated()
+                headers = list(message.get("headers", []))
+                headers.extend([
+                    (b"x-db-query-count", str(stats.count).encode()),
+                    (b"x-db-time-ms", f"{stats.seconds * 1000:.2f}".encode()),
+                    (b"x-db-max-repeats", str(repeats).encode()),
+                ])
+                if repeats > threshold:
+                    headers.append((b"x-db-n-plus-one", b"1"))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            query_stats_var.reset(token)
+            route = route_template(scope)
+            QUERIES_PER_REQUEST.observe(stats.count, route)
+            DB_TIME_PER_REQUEST.observe(stats.seconds, route)
+            shape, repeats = stats.most_repeated()
+            if repeats > threshold:
+                N_PLUS_ONE.inc(route)
+                logger.warning(
+                    "Possible N+1: %s %s ran one statement %s times",
+                    scope["method"], route, repeats,
+                    extra={"statement": shape, "query_count": stats.count}
+                )
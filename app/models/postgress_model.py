@@ -1,7 +1,7 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Float, Boolean, DateTime, Enum, ForeignKey, Text, Integer
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Float, Boolean, Date, DateTime, Enum, ForeignKey, Text, Integer, Index, Sequence, cast, func, text
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 import enum
 import uuid
 
@@ -30,9 +30,25 @@ class User(Base):
     role = Column(Enum(UserRole), nullable=False)
     password_hash = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
+    # Claims-mode access tokens issued below this version are revoked
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Keyset pagination order (created_at DESC, id DESC)
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+    
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)  # SHA-256 hex digest
+    family_id = Column(String, nullable=False, index=True)  # Shared by every rotation of one login
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 class Customer(Base):
     __tablename__ = "customers"
     
@@ -41,8 +57,22 @@ class Customer(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     phone = Column(String(50))
     address = Column(Text)
+    # Order aggregates kept by CustomerStatsService on every order write
+    order_count = Column(Integer, nullable=False, default=0, server_default="0")
+    lifetime_revenue = Column(Float, nullable=False, default=0.0, server_default="0")  # Completed orders
+    open_orders = Column(Integer, nullable=False, default=0, server_default="0")  # Pending or in progress
+    last_order_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Keyset pagination orders (<column> DESC, id DESC)
+    __table_args__ = (
+        Index("ix_customers_created_at_id", "created_at", "id"),
+        Index("ix_customers_order_count_id", "order_count", "id"),
+        Index("ix_customers_lifetime_revenue_id", "lifetime_revenue", "id"),
+        Index("ix_customers_open_orders_id", "open_orders", "id"),
+        Index("ix_customers_last_order_at_id", "last_order_at", "id"),
+    )
     
     orders = relationship("Order", back_populates="customer")
 
@@ -60,11 +90,22 @@ class Service(Base):
     
     orders = relationship("Order", back_populates="service")
 
+# Order numbers read ORD-YYYYMMDD-NNNNNNN. The suffix comes from a database
+# sequence, so numbers are unique across workers without a retry; seven
+# digits keep them apart from the older six-digit random suffixes.
+order_number_seq = Sequence("order_number_seq", metadata=Base.metadata)
+ORDER_NUMBER_DEFAULT = func.concat(
+    "ORD-",
+    func.to_char(func.timezone("utc", func.now()), "YYYYMMDD"),
+    "-",
+    func.lpad(cast(order_number_seq.next_value(), String), 7, "0")
+)
+
 class Order(Base):
     __tablename__ = "orders"
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    order_number = Column(String(50), unique=True, index=True, nullable=False)
+    order_number = Column(String(50), unique=True, index=True, nullable=False, default=ORDER_NUMBER_DEFAULT)
     customer_id = Column(String, ForeignKey("customers.id"), nullable=False)
     service_id = Column(String, ForeignKey("services.id"), nullable=False)
     description = Column(Text)
@@ -74,12 +115,32 @@ class Order(Base):
     unit_price = Column(Float)
     status = Column(Enum(OrderStatus), default=OrderStatus.PENDING)
     progress_notes = Column(Text)
+    # Full-text document over order, customer and service fields, kept by OrderSearchService
+    search_document = deferred(Column(TSVECTOR))
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # Keyset pagination order (created_at DESC, id DESC)
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        # A customer's orders, newest first; also re-reads last_order_at after deletes
+        Index("ix_orders_customer_id_created_at", "customer_id", "created_at"),
+        Index("ix_orders_search_document", "search_document", postgresql_using="gin"),
+    )
     
     customer = relationship("Customer", back_populates="orders")
     service = relationship("Service", back_populates="orders")
 
+class OrderDailyStat(Base):
+    __tablename__ = "order_daily_stats"
+    
+    # One row per order creation day, status and service, kept in step with orders
+    day = Column(Date, primary_key=True)
+    status = Column(Enum(OrderStatus), primary_key=True)
+    service_id = Column(String, ForeignKey("services.id"), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0.0)  # Sum of order amounts
+
 class Employee(Base):
     __tablename__ = "employees"
     
@@ -108,7 +169,37 @@ class Contact(Base):
     is_read = Column(Boolean, default=False)
     message = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Keyset pagination order (created_at DESC, id DESC)
+    __table_args__ = (Index("ix_contacts_created_at_id", "created_at", "id"),)
     
+class OutboxStatus(str, enum.Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+class OutboxMessage(Base):
+    __tablename__ = "outbox"
+    
+    # One notification to deliver, written in the same transaction as the
+    # change that caused it and sent by `python -m app.cli.dispatch_outbox`
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    channel = Column(String(20), nullable=False)  # "email" or "sms"
+    template = Column(String(100), nullable=False)  # EmailService/SMSService method
+    payload = Column(JSONB, nullable=False)  # Keyword arguments for the template
+    status = Column(Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    # Next time the message may be claimed; pushed forward while a dispatcher holds it
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime)
+
+    __table_args__ = (
+        # Claim order for pending messages only
+        Index("ix_outbox_pending_available_at", "available_at", postgresql_where=text("status = 'PENDING'")),
+    )
+
 class ExpenseType(str, enum.Enum):
     MATERIAL = "material"
     LABOR = "labor"
@@ -129,6 +220,9 @@ class Expense(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Keyset pagination order (coalesce(date, created_at) DESC, id DESC)
+    __table_args__ = (Index("ix_expenses_sort_date_id", func.coalesce(date, created_at), id),)
+
 class News(Base):
     __tablename__ = "news"
     
@@ -191,6 +285,9 @@ class Student(Base):
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Keyset pagination order (created_at DESC, id DESC)
+    __table_args__ = (Index("ix_students_created_at_id", "created_at", "id"),)
     
     
 class PaymentType(str, enum.Enum):
@@ -219,6 +316,9 @@ class Payment(Base):
     expires_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Keyset pagination order (created_at DESC, id DESC)
+    __table_args__ = (Index("ix_payments_created_at_id", "created_at", "id"),)
     
     # Relationship
     student = relationship("Student", backref="payments")
\ No newline at end of file
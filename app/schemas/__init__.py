@@ -1,14 +1,14 @@
-from .user import UserCreate, UserUpdate, UserResponse, UserLogin, Token
+from .user import UserCreate, UserUpdate, UserResponse, UserLogin, Token, RefreshRequest
 from .customer import CustomerCreate, CustomerUpdate, CustomerResponse
-from .order import OrderCreate, OrderUpdate, OrderResponse
+from .order import OrderCreate, OrderBulkCreate, OrderBulkStatusUpdate, OrderUpdate, OrderResponse
 from .service import ServiceCreate, ServiceUpdate, ServiceResponse
 from .employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
 from .contact import ContactCreate, ContactResponse, MessageSend
 
 __all__ = [
-    "UserCreate", "UserUpdate", "UserResponse", "UserLogin", "Token",
+    "UserCreate", "UserUpdate", "UserResponse", "UserLogin", "Token", "RefreshRequest",
     "CustomerCreate", "CustomerUpdate", "CustomerResponse",
-    "OrderCreate", "OrderUpdate", "OrderResponse",
+    "OrderCreate", "OrderBulkCreate", "OrderBulkStatusUpdate", "OrderUpdate", "OrderResponse",
     "ServiceCreate", "ServiceUpdate", "ServiceResponse",
     "EmployeeCreate", "EmployeeUpdate", "EmployeeResponse",
     "ContactCreate", "ContactResponse", "MessageSend"
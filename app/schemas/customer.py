@@ -20,6 +20,10 @@ class CustomerUpdate(BaseModel):
 
 class CustomerResponse(CustomerBase):
     id: str
+    order_count: int = 0
+    lifetime_revenue: float = 0.0  # Completed orders
+    open_orders: int = 0  # Pending or in progress
+    last_order_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     
@@ -1,5 +1,5 @@
-from pydantic import UUID4, BaseModel
-from typing import Optional
+from pydantic import UUID4, BaseModel, Field, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 
 from app.models.customer import Customer
@@ -22,6 +22,14 @@ class OrderBase(BaseModel):
 class OrderCreate(OrderBase):
     pass
 
+class OrderBulkCreate(BaseModel):
+    orders: List[OrderCreate] = Field(..., min_length=1, max_length=1000)
+
+class OrderBulkStatusUpdate(BaseModel):
+    order_ids: List[str] = Field(..., min_length=1, max_length=1000)
+    status: OrderStatus
+    progress_notes: Optional[str] = None
+
 class OrderUpdate(BaseModel):
     service_id: Optional[str] = None
     quantity: Optional[int] = None
@@ -48,4 +56,12 @@ class OrderResponse(OrderBase):
     customer: Optional[Customer] = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Built once; validates projected rows and serializes order lists straight to JSON
+ORDER_LIST_ADAPTER = TypeAdapter(List[OrderResponse])
+
+class OrderSearchResult(BaseModel):
+    order: OrderResponse
+    rank: float
+    snippet: Optional[str] = None  # Matching text with <mark> highlights
@@ -1,19 +1,27 @@
 from .auth_service import AuthService
+from .refresh_token_service import RefreshTokenService
 from .customer_service import CustomerService
 from .order_service import OrderService
+from .order_stats_service import OrderStatsService
 from .service_service import ServiceService
 from .employee_service import EmployeeService
 from .contact_service import ContactService
 from .sms_service import SMSService
 from .email_service import EmailService
+from .outbox_service import OutboxService
+from .notification_service import NotificationService
 
 __all__ = [
     "AuthService",
+    "RefreshTokenService",
     "CustomerService",
     "OrderService",
+    "OrderStatsService",
     "ServiceService",
     "EmployeeService",
     "ContactService",
     "SMSService",
-    "EmailService"
+    "EmailService",
+    "OutboxService",
+    "NotificationService"
 ]
\ No newline at end of file
@@ -1,24 +1,30 @@
 from datetime import datetime
 from typing import Optional
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+import logging
 
 from app.models.postgress_model import User
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
-from app.utils.helpers import get_password_hash, verify_password
+from app.config.settings import settings
+from app.utils.cache import principal_cache, token_versions
+from app.utils.helpers import create_access_token
+from app.utils.pagination import apply_keyset
+from app.utils.passwords import password_hasher
+
+logger = logging.getLogger(__name__)
 
 class AuthService:
     @staticmethod
     async def create_user(db: AsyncSession, user: UserCreate) -> UserResponse:
         """Create a new user"""
         # Check if user exists
-        print( "Creating user:", user)
+        logger.info("Creating user %s", user.email)
         
         result = await db.execute(
             select(User).where(User.email == user.email)
         )
-        print("User existence check result:", result)
         if result.scalar_one_or_none():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -31,7 +37,7 @@ class AuthService:
             full_name=user.full_name,
             phone=user.phone,
             role=user.role,
-            password_hash=get_password_hash(user.password),
+            password_hash=await password_hasher.hash(user.password),
             is_active=True
         )
         
@@ -52,7 +58,7 @@ class AuthService:
         if not user:
             return None
         
-        if not verify_password(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             return None
         
         if not user.is_active:
@@ -61,16 +67,55 @@ class AuthService:
                 detail="User account is inactive"
             )
         
+        if password_hasher.needs_rehash(user.password_hash):
+            password_hasher.schedule_rehash(User, user.id, password, user.password_hash)
+        
         return user
     
+    @staticmethod
+    def create_user_access_token(user: User) -> str:
+        """Create access token, embedding authorization claims in claims mode"""
+        data = {"sub": str(user.id)}
+        if settings.AUTH_CLAIMS_MODE:
+            data.update({
+                "role": user.role.value,
+                "active": bool(user.is_active),
+                "ver": user.token_version or 0,
+                "email": user.email,
+                "name": user.full_name
+            })
+        return create_access_token(data=data)
+    
+    @staticmethod
+    async def _revoke_tokens(db: AsyncSession, user_id: str) -> None:
+        """Revoke claims-mode tokens for user in the caller's transaction"""
+        await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(token_version=User.token_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+    
+    @staticmethod
+    def _invalidate_principal(user_id: str) -> None:
+        """Drop cached principal and token version for user"""
+        principal_cache.invalidate(user_id)
+        token_versions.invalidate(user_id)
+    
+    @staticmethod
+    async def get_token_version(db: AsyncSession, user_id: str) -> Optional[int]:
+        """Get the stored token version for user, or None if the user does not exist"""
+        result = await db.execute(
+            select(User.token_version).where(User.id == user_id)
+        )
+        return result.scalar_one_or_none()
+    
     @staticmethod
     async def get_user_by_id(db: AsyncSession, user_id: str) -> Optional[UserResponse]:
         """Get user by ID"""
-        print("Fetching user with ID:", user_id)
         result = await db.execute(
             select(User).where(User.id == user_id)
         )
-        print("Query result:", result)
         user = result.scalar_one_or_none()
         
         if not user:
@@ -105,9 +150,11 @@ class AuthService:
             setattr(user, field, value)
         
         user.updated_at = datetime.utcnow()
+        await AuthService._revoke_tokens(db, user_id)
         
         await db.commit()
         await db.refresh(user)
+        AuthService._invalidate_principal(user_id)
         
         return UserResponse.model_validate(user)
     
@@ -116,7 +163,8 @@ class AuthService:
         db: AsyncSession, 
         skip: int = 0, 
         limit: int = 100, 
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> list[UserResponse]:
         """List all users with optional search"""
         query = select(User)
@@ -128,7 +176,8 @@ class AuthService:
                 (User.full_name.ilike(search_pattern))
             )
         
-        query = query.offset(skip).limit(limit)
+        query = apply_keyset(query, [User.created_at, User.id], cursor)
+        query = query.order_by(User.created_at.desc(), User.id.desc()).offset(skip).limit(limit)
         result = await db.execute(query)
         users = result.scalars().all()
         
@@ -150,5 +199,7 @@ class AuthService:
         
         user.is_active = False
         user.updated_at = datetime.utcnow()
+        await AuthService._revoke_tokens(db, user_id)
         await db.commit()
+        AuthService._invalidate_principal(user_id)
         return True
\ No newline at end of file
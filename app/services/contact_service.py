@@ -1,24 +1,24 @@
-from typing import List
+from typing import List, Optional
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.postgress_model import Contact
 from app.schemas.contact import ContactCreate, ContactResponse
+from app.services.notification_service import NotificationService
+from app.utils.pagination import apply_keyset
 
 class ContactService:
     @staticmethod
     async def create_contact(db: AsyncSession, contact: ContactCreate) -> ContactResponse:
-        """Create a new contact submission"""
-        print('hey am here 3')
+        """Create a new contact submission and queue the admin alerts with it"""
         db_contact = Contact(**contact.model_dump(), is_read=False)
-        print('hey am here 4')
         db.add(db_contact)
+        await db.flush()
+        new_contact = ContactResponse.model_validate(db_contact)
+        NotificationService.contact_created(db, new_contact)
         await db.commit()
-        await db.refresh(db_contact)
-        print('hey am here 5')
-        # print("Created contact:", db_contact.)
-        return ContactResponse.model_validate(db_contact)
+        return new_contact
     
     @staticmethod
     async def get_contact(db: AsyncSession, contact_id: str) -> ContactResponse:
@@ -41,7 +41,8 @@ class ContactService:
         db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
-        unread_only: bool = False
+        unread_only: bool = False,
+        cursor: Optional[str] = None
     ) -> List[ContactResponse]:
         """List all contacts with optional filters"""
         query = select(Contact)
@@ -49,12 +50,21 @@ class ContactService:
         if unread_only:
             query = query.where(Contact.is_read == False)
         
-        query = query.order_by(Contact.created_at.desc()).offset(skip).limit(limit)
+        query = apply_keyset(query, [Contact.created_at, Contact.id], cursor)
+        query = query.order_by(Contact.created_at.desc(), Contact.id.desc()).offset(skip).limit(limit)
         result = await db.execute(query)
         contacts = result.scalars().all()
         
         return [ContactResponse.model_validate(c) for c in contacts]
     
+    @staticmethod
+    async def count_unread(db: AsyncSession) -> int:
+        """Count contact submissions not yet read"""
+        result = await db.execute(
+            select(func.count(Contact.id)).where(Contact.is_read == False)
+        )
+        return result.scalar_one()
+    
     @staticmethod
     async def mark_as_read(db: AsyncSession, contact_id: str) -> ContactResponse:
         """Mark contact as read"""
@@ -6,6 +6,23 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.postgress_model import Customer, Order
 from app.schemas.customer import CustomerCreate, CustomerUpdate, CustomerResponse
+from app.utils.pagination import apply_keyset
+from app.services.order_search_service import CUSTOMER_SEARCH_FIELDS, OrderSearchService
+
+# list_customers sort keys, each served by a (<column>, id) index
+CUSTOMER_SORTS = {
+    "created_at": Customer.created_at,
+    "order_count": Customer.order_count,
+    "lifetime_revenue": Customer.lifetime_revenue,
+    "open_orders": Customer.open_orders,
+    "last_order_at": Customer.last_order_at,
+}
+
+
+def customer_sort_key(sort: str):
+    """Cursor key for customers listed by sort"""
+    return lambda customer: (getattr(customer, sort), customer.id)
+
 
 class CustomerService:
     @staticmethod
@@ -34,10 +51,7 @@ class CustomerService:
         result = await db.execute(
             select(Customer).where(Customer.id == customer_id)
         )
-        print("Get customer result:", result)
         customer = result.scalar_one_or_none()
-        print("Get customer customer:", customer)
-        print("Get customer customer:", customer)
         if not customer:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -51,10 +65,23 @@ class CustomerService:
         db: AsyncSession, 
         skip: int = 0, 
         limit: int = 100, 
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        sort: str = "created_at"
     ) -> List[CustomerResponse]:
-        """List all customers with optional search"""
+        """List all customers with optional search, largest sort value first
+        
+        Sorting by last_order_at only lists customers who have ordered.
+        """
+        if sort not in CUSTOMER_SORTS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown sort: {sort}"
+            )
+        sort_column = CUSTOMER_SORTS[sort]
         query = select(Customer)
+        if sort == "last_order_at":
+            query = query.where(Customer.last_order_at.isnot(None))
         
         if search:
             search_pattern = f"%{search.lower()}%"
@@ -64,7 +91,8 @@ class CustomerService:
                 (Customer.phone.ilike(search_pattern))
             )
         
-        query = query.offset(skip).limit(limit)
+        query = apply_keyset(query, [sort_column, Customer.id], cursor)
+        query = query.order_by(sort_column.desc(), Customer.id.desc()).offset(skip).limit(limit)
         result = await db.execute(query)
         customers = result.scalars().all()
         
@@ -92,6 +120,11 @@ class CustomerService:
         for field, value in update_data.items():
             setattr(customer, field, value)
         
+        # Orders embed customer details in their search documents
+        if update_data.keys() & set(CUSTOMER_SEARCH_FIELDS):
+            await db.flush()
+            await OrderSearchService.refresh(db, customer_id=customer.id)
+        
         await db.commit()
         await db.refresh(customer)
         
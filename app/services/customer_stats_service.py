@@ -0,0 +1,165 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional, Sequence
+from sqlalchemy import DateTime, Float, Integer, String, cast, column, func, select, text, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.postgress_model import Customer, Order, OrderStatus
+
+# Statuses counted in Customer.open_orders
+OPEN_STATUSES = (OrderStatus.PENDING, OrderStatus.IN_PROGRESS)
+# What one order adds to its customer: (customer_id, completed revenue, open orders)
+Contribution = tuple[str, float, int]
+
+
+class CustomerStatsService:
+    @staticmethod
+    def snapshot(customer_id: str, order_status, amount: Optional[float]) -> Contribution:
+        """Revenue and open-order count an order in order_status adds to its customer"""
+        order_status = OrderStatus(order_status)
+        revenue = (amount or 0.0) if order_status == OrderStatus.COMPLETED else 0.0
+        return customer_id, revenue, int(order_status in OPEN_STATUSES)
+
+    @staticmethod
+    async def apply(
+        db: AsyncSession,
+        changes: Iterable[tuple[str, int, float, int, Optional[datetime]]],
+        recompute_last_order: bool = False
+    ) -> None:
+        """Add (customer_id, orders, revenue, open orders, order time) deltas in the caller's transaction
+
+        Deltas are merged per customer and applied with one UPDATE ... FROM
+        (VALUES ...). last_order_at only moves forward unless
+        recompute_last_order is set, which re-reads it after deletes.
+        """
+        merged = defaultdict(lambda: [0, 0.0, 0, None])
+        for customer_id, count, revenue, open_orders, ordered_at in changes:
+            totals = merged[customer_id]
+            totals[0] += count
+            totals[1] += revenue
+            totals[2] += open_orders
+            if ordered_at is not None and (totals[3] is None or ordered_at > totals[3]):
+                totals[3] = ordered_at
+
+        rows = [
+            (customer_id, count, revenue, open_orders, ordered_at)
+            for customer_id, (count, revenue, open_orders, ordered_at) in merged.items()
+            if count or revenue or open_orders or ordered_at
+        ]
+        if not rows:
+            return
+
+        deltas = values(
+            column("customer_id", String),
+            column("order_count", Integer),
+            column("revenue", Float),
+            column("open_orders", Integer),
+            column("last_order_at", DateTime),
+            name="deltas"
+        ).data(rows)
+        if recompute_last_order:
+            last_order_at = (
+                select(func.max(Order.created_at))
+                .where(Order.customer_id == Customer.id)
+                .scalar_subquery()
+            )
+        else:
+            # VALUES infers its column types from the rows, so a column of
+            # only NULLs (status changes) comes back as text without the cast
+            last_order_at = func.greatest(Customer.last_order_at, cast(deltas.c.last_order_at, DateTime))
+
+        await db.execute(
+            update(Customer)
+            .where(Customer.id == deltas.c.customer_id)
+            .values(
+                order_count=Customer.order_count + deltas.c.order_count,
+                lifetime_revenue=Customer.lifetime_revenue + deltas.c.revenue,
+                open_orders=Customer.open_orders + deltas.c.open_orders,
+                last_order_at=last_order_at,
+                # Order activity is not an edit of the customer
+                updated_at=Customer.updated_at
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def record_created(db: AsyncSession, orders: Iterable[Order]) -> None:
+        """Count newly created orders"""
+        changes = []
+        for order in orders:
+            customer_id, revenue, open_orders = CustomerStatsService.snapshot(
+                order.customer_id, order.status, order.amount
+            )
+            changes.append((customer_id, 1, revenue, open_orders, order.created_at))
+        await CustomerStatsService.apply(db, changes)
+
+    @staticmethod
+    async def record_deleted(db: AsyncSession, orders: Iterable[Order]) -> None:
+        """Remove deleted orders from their customers"""
+        changes = []
+        for order in orders:
+            customer_id, revenue, open_orders = CustomerStatsService.snapshot(
+                order.customer_id, order.status, order.amount
+            )
+            changes.append((customer_id, -1, -revenue, -open_orders, None))
+        await CustomerStatsService.apply(db, changes, recompute_last_order=True)
+
+    @staticmethod
+    async def record_changes(db: AsyncSession, changes: Iterable[tuple[Contribution, Order]]) -> None:
+        """Apply status or amount changes given as (before, order) pairs"""
+        deltas = []
+        for (customer_id, old_revenue, old_open), order in changes:
+            _, revenue, open_orders = CustomerStatsService.snapshot(
+                order.customer_id, order.status, order.amount
+            )
+            deltas.append((customer_id, 0, revenue - old_revenue, open_orders - old_open, None))
+        await CustomerStatsService.apply(db, deltas)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, customer_ids: Sequence[str]) -> int:
+        """Recompute the aggregates of the given customers from orders
+
+        Takes a SHARE lock on orders so concurrent writes wait for the batch
+        to commit instead of being double counted or lost.
+        """
+        await db.execute(text("LOCK TABLE orders IN SHARE MODE"))
+        totals = (
+            select(
+                Customer.id.label("customer_id"),
+                func.count(Order.id).label("order_count"),
+                func.coalesce(
+                    func.sum(Order.amount).filter(Order.status == OrderStatus.COMPLETED), 0.0
+                ).label("revenue"),
+                func.count(Order.id).filter(Order.status.in_(OPEN_STATUSES)).label("open_orders"),
+                func.max(Order.created_at).label("last_order_at")
+            )
+            .select_from(Customer)
+            .outerjoin(Order, Order.customer_id == Customer.id)
+            .where(Customer.id.in_(customer_ids))
+            .group_by(Customer.id)
+            .subquery("totals")
+        )
+        result = await db.execute(
+            update(Customer)
+            .where(Customer.id == totals.c.customer_id)
+            .values(
+                order_count=totals.c.order_count,
+                lifetime_revenue=totals.c.revenue,
+                open_orders=totals.c.open_orders,
+                last_order_at=totals.c.last_order_at,
+                updated_at=Customer.updated_at
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @staticmethod
+    async def backfill_batch(db: AsyncSession, after_id: Optional[str], batch_size: int) -> list[str]:
+        """Rebuild the next batch of customers by id and return their ids"""
+        query = select(Customer.id).order_by(Customer.id).limit(batch_size)
+        if after_id is not None:
+            query = query.where(Customer.id > after_id)
+        ids = (await db.execute(query)).scalars().all()
+        if ids:
+            await CustomerStatsService.rebuild(db, ids)
+        return list(ids)
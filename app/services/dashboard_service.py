@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.firebase import in_own_session
+from app.schemas.news import NewsResponse
+from app.services.contact_service import ContactService
+from app.services.expenses import ExpenseService
+from app.services.news_service import NewsService
+from app.services.order_service import OrderService
+from app.services.payment_service import PaymentService
+from app.utils.cache import stats_cache
+
+logger = logging.getLogger(__name__)
+
+# Current news items shown on the dashboard
+DASHBOARD_NEWS_LIMIT = 5
+
+
+async def _current_news(db: AsyncSession) -> list:
+    news = await NewsService.get_all_news(db, limit=DASHBOARD_NEWS_LIMIT, current_only=True)
+    return [NewsResponse.model_validate(item) for item in news]
+
+
+class DashboardService:
+    @staticmethod
+    def _sections(period: Optional[str]) -> dict[str, Callable[[], Awaitable]]:
+        """Section name to a coroutine factory running on its own session
+
+        Sections that have a statistics endpoint share its cache entry, so
+        the dashboard and the individual pages reuse each other's results.
+        """
+        order_params = {
+            "period": period,
+            "year": None,
+            "month": None,
+            "start_date": None,
+            "end_date": None,
+            "include_monthly_breakdown": False,
+            "include_comparison": False
+        }
+        expense_params = {"year": None, "month": None, "start_date": None, "end_date": None}
+
+        return {
+            "orders": lambda: stats_cache.get_or_compute(
+                "orders.statistics", order_params, ("orders",),
+                in_own_session(lambda db: OrderService.get_order_statistics(db=db, **order_params))
+            ),
+            "expenses": lambda: stats_cache.get_or_compute(
+                "expenses.statistics", expense_params, ("expenses",),
+                in_own_session(lambda db: ExpenseService.get_expense_statistics(db, **expense_params))
+            ),
+            "payments": lambda: stats_cache.get_or_compute(
+                "payments.statistics", {}, ("payments",),
+                in_own_session(PaymentService.get_payment_statistics)
+            ),
+            "unread_contacts": in_own_session(ContactService.count_unread),
+            "news": lambda: stats_cache.get_or_compute(
+                "news.current", {"limit": DASHBOARD_NEWS_LIMIT}, ("news",),
+                in_own_session(_current_news)
+            ),
+        }
+
+    @staticmethod
+    async def get_summary(period: Optional[str] = None) -> dict:
+        """Compute every dashboard section concurrently
+
+        Each section runs on its own pooled session, so the response takes
+        about as long as the slowest section. A failing section is reported
+        under ``errors`` instead of failing the whole dashboard.
+        """
+        async def timed(name: str, compute: Callable[[], Awaitable]):
+            started = time.perf_counter()
+            try:
+                return name, await compute(), None, time.perf_counter() - started
+            except Exception as e:
+                logger.exception("Dashboard section %s failed", name)
+                return name, None, f"{type(e).__name__}: {e}", time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(
+            timed(name, compute) for name, compute in DashboardService._sections(period).items()
+        ))
+
+        summary = {"sections": {}, "timings_ms": {}, "errors": {}}
+        for name, data, error, elapsed in results:
+            summary["sections"][name] = data
+            summary["timings_ms"][name] = round(elapsed * 1000, 2)
+            if error:
+                summary["errors"][name] = error
+        summary["timings_ms"]["total"] = round((time.perf_counter() - started) * 1000, 2)
+        return summary
@@ -48,13 +48,12 @@ class EmailService:
         
          return True
         except Exception as e:
-          print(f"Failed to send email to {to_email}: {e}")
+          logger.error("Failed to send email to %s: %s", to_email, e)
     
           return False
         finally:
         # Close the connection
           server.quit()
-          return True
 
     
     async def send_bulk_email(self, recipients: List[str], subject: str, content: str, html_content: str = None) -> dict:
@@ -118,6 +117,32 @@ InnoTrend Team
         
         return await self.send_email(to_email, subject, content, html_content)
     
+    async def send_orders_confirmation(self, to_email: str, customer_name: str, orders: List[tuple]) -> bool:
+        """Send one confirmation email for several orders given as (order_number, product_service, amount)"""
+        subject = f"Order Confirmation - {len(orders)} orders"
+        lines = "\n".join(
+            f"- {order_number}: {product_service} (${amount:.2f})"
+            for order_number, product_service, amount in orders
+        )
+        total = sum(amount for _, _, amount in orders)
+        content = f"""
+Dear {customer_name},
+
+Thank you for your orders with InnoTrend!
+
+Order Details:
+{lines}
+
+Total: ${total:.2f}
+
+We will process your orders shortly and keep you updated on their progress.
+
+Best regards,
+InnoTrend Team
+        """
+        
+        return await self.send_email(to_email, subject, content)
+    
     async def send_order_update(self, to_email: str, order_number: str, customer_name: str, status: str, progress_notes: str = None) -> bool:
         """Send order status update email"""
         subject = f"Order Update - {order_number}"
@@ -131,6 +156,24 @@ Current Status: {status}
 
 Thank you for choosing innoTrend!
 
+Best regards,
+InnoTrend Team
+        """
+        
+        return await self.send_email(to_email, subject, content)
+    
+    async def send_orders_update(self, to_email: str, customer_name: str, status: str, order_numbers: List[str]) -> bool:
+        """Send one status update email for several orders"""
+        subject = f"Order Update - {len(order_numbers)} orders {status}"
+        lines = "\n".join(f"- {order_number}" for order_number in order_numbers)
+        content = f"""
+Dear {customer_name},
+
+The following orders are now {status}:
+{lines}
+
+Thank you for choosing innoTrend!
+
 Best regards,
 InnoTrend Team
         """
@@ -9,6 +9,8 @@ from fastapi import HTTPException, status
 
 from app.models.postgress_model import Expense, ExpenseType
 from app.schemas.expenses import ExpenseCreate, ExpenseUpdate
+from app.utils.cache import stats_cache
+from app.utils.pagination import apply_keyset
 
 
 def to_naive_utc(dt: datetime) -> datetime:
@@ -18,6 +20,9 @@ def to_naive_utc(dt: datetime) -> datetime:
     if dt.tzinfo is not None:
         return dt.astimezone(timezone.utc).replace(tzinfo=None)
     return 
+# Expenses whose date was never set sort by creation time
+EXPENSE_SORT_DATE = func.coalesce(Expense.date, Expense.created_at)
+
 class ExpenseService:
     @staticmethod
     async def create_expense(db: AsyncSession, expense_data: ExpenseCreate) -> Expense:
@@ -29,6 +34,7 @@ class ExpenseService:
         db.add(expense)
       
         await db.commit()
+        stats_cache.invalidate("expenses")
         await db.refresh(expense)
         return expense
     
@@ -51,10 +57,11 @@ class ExpenseService:
         limit: int = 100,
         type: Optional[ExpenseType] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None
     ) -> List[Expense]:
         """Get all expenses with optional filters"""
-        query = select(Expense).order_by(Expense.date.desc())
+        query = select(Expense).order_by(EXPENSE_SORT_DATE.desc(), Expense.id.desc())
         
         filters = []
         if type:
@@ -67,6 +74,7 @@ class ExpenseService:
         if filters:
             query = query.where(and_(*filters))
         
+        query = apply_keyset(query, [EXPENSE_SORT_DATE, Expense.id], cursor)
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
         return result.scalars().all()
@@ -87,6 +95,7 @@ class ExpenseService:
         
         expense.updated_at = datetime.utcnow()
         await db.commit()
+        stats_cache.invalidate("expenses")
         await db.refresh(expense)
         return expense 
     
@@ -96,6 +105,7 @@ class ExpenseService:
         expense = await ExpenseService.get_expense(db, expense_id)
         await db.delete(expense)
         await db.commit()
+        stats_cache.invalidate("expenses")
         return True
     
     @staticmethod
@@ -9,6 +9,7 @@ from fastapi import HTTPException, status
 from app.models.postgress_model import News
 from app.schemas.news import NewsCreate, NewsUpdate
 from app.services.expenses import to_naive_utc
+from app.utils.cache import stats_cache
 
 
 
@@ -22,6 +23,7 @@ class NewsService:
         news = News(**news_data.model_dump())
         db.add(news)
         await db.commit()
+        stats_cache.invalidate("news")
         await db.refresh(news)
         return news
     
@@ -93,6 +95,7 @@ class NewsService:
         
         news.updated_at = datetime.utcnow()
         await db.commit()
+        stats_cache.invalidate("news")
         await db.refresh(news)
         return news
     
@@ -102,6 +105,7 @@ class NewsService:
         news = await NewsService.get_news(db, news_id)
         await db.delete(news)
         await db.commit()
+        stats_cache.invalidate("news")
         return True
     
     @staticmethod
@@ -111,6 +115,7 @@ class NewsService:
         news.active = not news.active
         news.updated_at = datetime.utcnow()
         await db.commit()
+        stats_cache.invalidate("news")
         await db.refresh(news)
         return news
     
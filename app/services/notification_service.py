@@ -0,0 +1,134 @@
+import asyncio
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.contact import ContactResponse
+from app.schemas.order import OrderResponse
+from app.services.email_service import EmailService
+from app.services.outbox_service import OUTBOX_TEMPLATES, OutboxService
+from app.services.sms_service import SMSService
+
+
+class NotificationService:
+    @staticmethod
+    def order_created(db: AsyncSession, order: OrderResponse) -> None:
+        """Queue the customer's confirmation for a new order"""
+        OutboxService.enqueue(
+            db, "email", "send_order_confirmation",
+            to_email=order.customer.email,
+            order_number=order.order_number,
+            customer_name=order.customer.name,
+            product_service=order.service.title,
+            amount=order.amount
+        )
+        if order.customer.phone:
+            OutboxService.enqueue(
+                db, "sms", "send_order_notification",
+                phone_number=order.customer.phone,
+                order_number=order.order_number,
+                status=order.status.value
+            )
+
+    @staticmethod
+    def orders_created(db: AsyncSession, orders: List[OrderResponse]) -> None:
+        """Queue one confirmation per customer for a bulk import"""
+        by_customer = {}
+        for order in orders:
+            by_customer.setdefault(order.customer_id, []).append(order)
+
+        for customer_orders in by_customer.values():
+            if len(customer_orders) == 1:
+                NotificationService.order_created(db, customer_orders[0])
+                continue
+
+            customer = customer_orders[0].customer
+            OutboxService.enqueue(
+                db, "email", "send_orders_confirmation",
+                to_email=customer.email,
+                customer_name=customer.name,
+                orders=[(o.order_number, o.service.title, o.amount) for o in customer_orders]
+            )
+            if customer.phone:
+                OutboxService.enqueue(
+                    db, "sms", "send_orders_received",
+                    phone_number=customer.phone,
+                    order_numbers=[o.order_number for o in customer_orders]
+                )
+
+    @staticmethod
+    def order_status_changed(db: AsyncSession, order: OrderResponse) -> None:
+        """Queue the customer's update after a status change"""
+        if order.customer.phone:
+            OutboxService.enqueue(
+                db, "sms", "send_order_notification",
+                phone_number=order.customer.phone,
+                order_number=order.order_number,
+                status=order.status.value
+            )
+        OutboxService.enqueue(
+            db, "email", "send_order_update",
+            to_email=order.customer.email,
+            order_number=order.order_number,
+            customer_name=order.customer.name,
+            status=order.status.value,
+            progress_notes=order.progress_notes
+        )
+
+    @staticmethod
+    def orders_status_changed(db: AsyncSession, orders: List[OrderResponse]) -> None:
+        """Queue one update per customer after a bulk status change"""
+        by_customer = {}
+        for order in orders:
+            by_customer.setdefault(order.customer_id, []).append(order)
+
+        for customer_orders in by_customer.values():
+            if len(customer_orders) == 1:
+                NotificationService.order_status_changed(db, customer_orders[0])
+                continue
+
+            customer = customer_orders[0].customer
+            order_status = customer_orders[0].status.value
+            order_numbers = [o.order_number for o in customer_orders]
+            if customer.phone:
+                OutboxService.enqueue(
+                    db, "sms", "send_orders_update",
+                    phone_number=customer.phone,
+                    order_numbers=order_numbers,
+                    status=order_status
+                )
+            OutboxService.enqueue(
+                db, "email", "send_orders_update",
+                to_email=customer.email,
+                customer_name=customer.name,
+                status=order_status,
+                order_numbers=order_numbers
+            )
+
+    @staticmethod
+    def contact_created(db: AsyncSession, contact: ContactResponse) -> None:
+        """Queue the admin alerts for a contact form submission"""
+        OutboxService.enqueue(
+            db, "sms", "notify_admin_contact_form",
+            customer_name=contact.name,
+            customer_email=contact.email
+        )
+        OutboxService.enqueue(
+            db, "email", "notify_admin_contact_form",
+            name=contact.name,
+            email=contact.email,
+            message=contact.message,
+            phone=contact.phone
+        )
+
+    @staticmethod
+    def deliver(channel: str, template: str, payload: dict) -> bool:
+        """Send one outbox message through its provider
+
+        The provider clients block (smtplib, requests), so the dispatcher
+        calls this from a worker thread and it runs the template coroutine
+        on that thread's own event loop.
+        """
+        if template not in OUTBOX_TEMPLATES.get(channel, ()):
+            raise ValueError(f"Unknown {channel} template: {template}")
+        service = EmailService() if channel == "email" else SMSService()
+        return asyncio.run(getattr(service, template)(**payload))
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncContextManager, AsyncIterator, Callable, Optional
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.firebase import AsyncSessionLocal
+from app.models.postgress_model import Customer, Order, OrderStatus, Service
+from app.services.order_service import OrderService
+
+# Rows fetched from the server-side cursor and written per chunk
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+EXPORT_COLUMNS = [
+    Order.id,
+    Order.order_number,
+    Order.created_at,
+    Order.updated_at,
+    Order.status,
+    Order.customer_id,
+    Customer.name.label("customer_name"),
+    Customer.email.label("customer_email"),
+    Customer.phone.label("customer_phone"),
+    Order.service_id,
+    Service.title.label("service_title"),
+    Order.description,
+    Order.quantity,
+    Order.color,
+    Order.unit_price,
+    Order.amount,
+    Order.progress_notes,
+]
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+def _plain(value):
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+class OrderExportService:
+    @staticmethod
+    def _format_csv(rows, header: bool) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if header:
+            writer.writerow(EXPORT_FIELDS)
+        writer.writerows([_plain(value) for value in row] for row in rows)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _format_ndjson(rows) -> str:
+        return "".join(
+            json.dumps({field: _plain(value) for field, value in zip(EXPORT_FIELDS, row)}) + "\n"
+            for row in rows
+        )
+
+    @staticmethod
+    async def export_orders(
+        export_format: str,
+        status: Optional[OrderStatus] = None,
+        customer_id: Optional[str] = None,
+        search: Optional[str] = None,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]] = AsyncSessionLocal
+    ) -> AsyncIterator[str]:
+        """Yield orders as CSV or NDJSON chunks, newest first
+
+        Streams flat rows from a server-side cursor in EXPORT_BATCH_SIZE
+        batches, so memory stays constant however many orders match. Opens its
+        own session from session_factory because the response outlives the
+        request's dependencies.
+        """
+        query = (
+            select(*EXPORT_COLUMNS)
+            .join(Customer, Order.customer_id == Customer.id)
+            .join(Service, Order.service_id == Service.id)
+            .order_by(Order.created_at.desc(), Order.id.desc())
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        filters = OrderService.list_filters(status, customer_id, search)
+        if filters:
+            query = query.where(and_(*filters))
+
+        async with session_factory() as session:
+            result = await session.stream(query)
+            if export_format == "csv":
+                yield OrderExportService._format_csv([], header=True)
+            async for rows in result.partitions():
+                if export_format == "csv":
+                    yield OrderExportService._format_csv(rows, header=False)
+                else:
+                    yield OrderExportService._format_ndjson(rows)
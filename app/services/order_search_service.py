@@ -0,0 +1,133 @@
+from typing import Optional, Sequence
+from sqlalchemy import and_, func, literal_column, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.postgress_model import Customer, Order, Service
+from app.schemas.order import OrderResponse, OrderSearchResult
+
+# Text search configuration used for both documents and queries
+SEARCH_CONFIG = "english"
+# Customer and service columns copied into an order's search document
+CUSTOMER_SEARCH_FIELDS = ("name", "email", "phone")
+SERVICE_SEARCH_FIELDS = ("title",)
+
+
+def _weighted(value, weight: str):
+    # setweight takes a "char"; a bound string would arrive as varchar, so the
+    # (internal, fixed) weight letter is inlined as an untyped literal
+    return func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, func.coalesce(value, "")),
+        literal_column(f"'{weight}'")
+    )
+
+
+def search_query(text: str):
+    """Parse user input with web-search syntax ("quoted phrases", -exclusions, or)"""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, text)
+
+
+def search_matches(text: str):
+    """Predicate matching orders whose search document satisfies text"""
+    return Order.search_document.bool_op("@@")(search_query(text))
+
+
+class OrderSearchService:
+    @staticmethod
+    def document(order_number=Order.order_number, description=Order.description):
+        """Search document for an order joined to its customer and service
+
+        Order fields default to the stored columns; writes pass the new
+        values so the document can be computed inside the same statement.
+        """
+        return (
+            _weighted(order_number, "A")
+            .op("||")(_weighted(Customer.name, "A"))
+            .op("||")(_weighted(Customer.email, "B"))
+            .op("||")(_weighted(Customer.phone, "B"))
+            .op("||")(_weighted(Service.title, "B"))
+            .op("||")(_weighted(description, "C"))
+        )
+
+    @staticmethod
+    async def refresh(
+        db: AsyncSession,
+        order_ids: Optional[Sequence[str]] = None,
+        customer_id: Optional[str] = None,
+        service_id: Optional[str] = None
+    ) -> int:
+        """Rebuild search documents for the given orders, or for every order of a customer or service
+
+        Runs in the caller's transaction; flush pending changes first.
+        """
+        scope = []
+        if order_ids is not None:
+            scope.append(Order.id.in_(order_ids))
+        if customer_id is not None:
+            scope.append(Order.customer_id == customer_id)
+        if service_id is not None:
+            scope.append(Order.service_id == service_id)
+        if not scope:
+            raise ValueError("refresh needs order_ids, customer_id or service_id")
+
+        result = await db.execute(
+            update(Order)
+            .where(
+                and_(
+                    Order.customer_id == Customer.id,
+                    Order.service_id == Service.id,
+                    *scope
+                )
+            )
+            .values(search_document=OrderSearchService.document())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        text: str,
+        skip: int = 0,
+        limit: int = 20
+    ) -> list[OrderSearchResult]:
+        """Rank orders against a search query and highlight the matching text"""
+        tsquery = search_query(text)
+        rank = func.ts_rank_cd(Order.search_document, tsquery)
+        # Only evaluated for the rows that survive ORDER BY ... LIMIT
+        snippet = func.ts_headline(
+            SEARCH_CONFIG,
+            func.concat_ws(" | ", Order.order_number, Customer.name, Service.title, Order.description),
+            tsquery,
+            "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5"
+        )
+
+        result = await db.execute(
+            select(Order, rank.label("rank"), snippet.label("snippet"))
+            .join(Customer, Order.customer_id == Customer.id)
+            .join(Service, Order.service_id == Service.id)
+            .options(selectinload(Order.customer), selectinload(Order.service))
+            .where(Order.search_document.bool_op("@@")(tsquery))
+            .order_by(rank.desc(), Order.created_at.desc(), Order.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return [
+            OrderSearchResult(
+                order=OrderResponse.model_validate(order),
+                rank=float(row_rank),
+                snippet=row_snippet
+            )
+            for order, row_rank, row_snippet in result
+        ]
+
+    @staticmethod
+    async def backfill_batch(db: AsyncSession, after_id: Optional[str], batch_size: int) -> list[str]:
+        """Rebuild documents for the next batch of orders by id and return their ids"""
+        query = select(Order.id).order_by(Order.id).limit(batch_size)
+        if after_id is not None:
+            query = query.where(Order.id > after_id)
+        ids = (await db.execute(query)).scalars().all()
+        if ids:
+            await OrderSearchService.refresh(db, order_ids=ids)
+        return list(ids)
@@ -1,13 +1,52 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Optional, List
 from fastapi import HTTPException, status
-from sqlalchemy import and_, case, extract, select, func
+import uuid
+from sqlalchemy import DateTime, Integer, String, and_, any_, cast, delete, insert, literal, literal_column, or_, select, func, true, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.config.settings import settings
+from app.models.postgress_model import (
+    ORDER_NUMBER_DEFAULT, Customer, Order, OrderDailyStat, OrderStatus, Service
+)
+from app.schemas.order import ORDER_LIST_ADAPTER, OrderBulkStatusUpdate, OrderCreate, OrderUpdate, OrderResponse
+from app.utils.cache import stats_cache
+from app.utils.pagination import apply_keyset
+from app.services.order_stats_service import OrderStatsService
+from app.services.customer_stats_service import CustomerStatsService
+from app.services.notification_service import NotificationService
+from app.services.order_search_service import OrderSearchService, search_matches
+
+# generate_series step per date_trunc unit
+TIMESERIES_STEPS = {"day": "1 day", "week": "1 week", "month": "1 month", "quarter": "3 months"}
+TIMESERIES_BUCKET_DAYS = {"day": 1, "week": 7, "month": 28, "quarter": 90}
+MAX_TIMESERIES_BUCKETS = 5000
+# Columns projected for OrderResponse by list_orders and returned by writes
+ORDER_FIELDS = (
+    "id", "order_number", "customer_id", "service_id", "description", "amount", "quantity",
+    "color", "unit_price", "status", "progress_notes", "created_at", "updated_at"
+)
+CUSTOMER_FIELDS = ("id", "name", "email", "phone", "address", "created_at", "updated_at")
+SERVICE_FIELDS = ("id", "title", "description", "icon", "image_url", "is_active", "created_at", "updated_at")
+RELATED_COLUMNS = (
+    [getattr(Customer, field).label(f"customer__{field}") for field in CUSTOMER_FIELDS]
+    + [getattr(Service, field).label(f"service__{field}") for field in SERVICE_FIELDS]
+)
+ORDER_LIST_COLUMNS = [getattr(Order, field).label(field) for field in ORDER_FIELDS] + RELATED_COLUMNS
+# Order fields that feed the search document
+SEARCH_FIELDS = {"order_number", "description", "customer_id", "service_id"}
+
+
+def _nest_row(row) -> dict:
+    """Nest a flat row of ORDER_LIST_COLUMNS labels into OrderResponse shape"""
+    item = {field: row[field] for field in ORDER_FIELDS}
+    item["customer"] = {field: row[f"customer__{field}"] for field in CUSTOMER_FIELDS}
+    item["service"] = {field: row[f"service__{field}"] for field in SERVICE_FIELDS}
+    return item
 
-from app.models.postgress_model import Customer, Order, OrderStatus, Service
-from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse
-from app.utils.helpers import generate_order_number
 
 class OrderService:
     @staticmethod
@@ -33,19 +72,111 @@ class OrderService:
     
     @staticmethod
     async def create_order(db: AsyncSession, order: OrderCreate) -> OrderResponse:
-        """Create a new order"""
-        await OrderService._verify_relations(db, order.customer_id, order.service_id)
+        """Create a new order
+        
+        One INSERT ... SELECT inside a CTE checks the customer and service
+        exist, draws the order number, builds the search document and
+        returns the order joined to both; the rollup upsert is the second
+        statement.
+        """
+        orders = Order.__table__
+        now = datetime.utcnow()
+        values = order.model_dump()
+        values.update(
+            id=str(uuid.uuid4()),
+            status=OrderStatus(values["status"] or OrderStatus.PENDING),
+            created_at=now,
+            updated_at=now
+        )
         
-        db_order = Order(
-            **order.model_dump(),
-            order_number=generate_order_number()
+        number = select(ORDER_NUMBER_DEFAULT.label("order_number")).subquery("number")
+        description = literal(values["description"], orders.c.description.type)
+        source = select(
+            *[literal(value, orders.c[field].type) for field, value in values.items()],
+            number.c.order_number,
+            OrderSearchService.document(order_number=number.c.order_number, description=description)
+        ).select_from(
+            number
+            .join(Customer, Customer.id == values["customer_id"])
+            .join(Service, Service.id == values["service_id"])
+        )
+        inserted = (
+            insert(orders)
+            .from_select([*values, "order_number", "search_document"], source, include_defaults=False)
+            .returning(*[orders.c[field] for field in ORDER_FIELDS])
+            .cte("inserted")
         )
+        result = await db.execute(
+            select(*[inserted.c[field].label(field) for field in ORDER_FIELDS], *RELATED_COLUMNS)
+            .join_from(inserted, Customer, Customer.id == inserted.c.customer_id)
+            .join(Service, Service.id == inserted.c.service_id)
+        )
+        row = result.mappings().one_or_none()
+        if row is None:
+            await OrderService._verify_relations(db, order.customer_id, order.service_id)
+            # Both exist now, so one of them changed while the insert ran
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Customer or service changed while creating the order, please retry"
+            )
+        
+        created = OrderResponse.model_validate(_nest_row(row))
+        await OrderStatsService.record_created(db, [created])
+        await CustomerStatsService.record_created(db, [created])
+        NotificationService.order_created(db, created)
+        await db.commit()
+        stats_cache.invalidate("orders")
+        
+        return created
+    
+    @staticmethod
+    async def _load_by_ids(db: AsyncSession, model, ids: set) -> dict:
+        """Load rows of model for ids with one IN query, raising 404 for any missing"""
+        result = await db.execute(select(model).where(model.id.in_(ids)))
+        found = {row.id: row for row in result.scalars()}
+        missing = ids - found.keys()
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{model.__name__} not found: {', '.join(sorted(missing))}"
+            )
+        return found
+    
+    @staticmethod
+    async def create_orders_bulk(db: AsyncSession, orders: List[OrderCreate]) -> List[OrderResponse]:
+        """Create many orders with one relation check per table and one INSERT ... RETURNING"""
+        customers = await OrderService._load_by_ids(db, Customer, {o.customer_id for o in orders})
+        services = await OrderService._load_by_ids(db, Service, {o.service_id for o in orders})
+        
+        now = datetime.utcnow()
+        rows = []
+        for order in orders:
+            # order_number is left to its sequence-backed column default
+            row = order.model_dump()
+            row.update(
+                id=str(uuid.uuid4()),
+                status=row["status"] or OrderStatus.PENDING,
+                created_at=now,
+                updated_at=now
+            )
+            rows.append(row)
+        
+        result = await db.execute(insert(Order).values(rows).returning(Order))
+        created = result.scalars().all()
         
-        db.add(db_order)
+        for db_order in created:
+            set_committed_value(db_order, "customer", customers[db_order.customer_id])
+            set_committed_value(db_order, "service", services[db_order.service_id])
+        responses = [OrderResponse.model_validate(db_order) for db_order in created]
+        
+        await OrderStatsService.record_created(db, created)
+        await CustomerStatsService.record_created(db, created)
+        await OrderSearchService.refresh(db, order_ids=[o.id for o in created])
+        NotificationService.orders_created(db, responses)
         await db.commit()
-        await db.refresh(db_order, ['customer', 'service'])
+        stats_cache.invalidate("orders")
         
-        return OrderResponse.model_validate(db_order)
+        return responses
     
     @staticmethod
     async def get_order(db: AsyncSession, order_id: str) -> OrderResponse:
@@ -65,6 +196,25 @@ class OrderService:
         
         return OrderResponse.model_validate(order)
     
+    @staticmethod
+    def list_filters(
+        status: Optional[OrderStatus] = None,
+        customer_id: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> list:
+        """Build the WHERE criteria shared by order listing and export"""
+        filters = []
+        if status:
+            filters.append(Order.status == status)
+        
+        if customer_id:
+            filters.append(Order.customer_id == customer_id)
+        
+        if search:
+            # Full-text match on the maintained search document (GIN indexed)
+            filters.append(search_matches(search))
+        return filters
+    
     @staticmethod
     async def list_orders(
         db: AsyncSession,
@@ -72,35 +222,31 @@ class OrderService:
         limit: int = 100,
         status: Optional[OrderStatus] = None,
         customer_id: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[OrderResponse]:
-        """List all orders with optional filters"""
-        query = select(Order).options(
-            selectinload(Order.customer),
-            selectinload(Order.service)
+        """List all orders with optional filters
+        
+        Selects only the columns OrderResponse needs through one join and
+        validates the plain rows in a single TypeAdapter pass, so no ORM
+        entities, identity map entries or selectinload queries are created.
+        """
+        query = (
+            select(*ORDER_LIST_COLUMNS)
+            .join(Customer, Order.customer_id == Customer.id)
+            .join(Service, Order.service_id == Service.id)
         )
         
         # Apply filters
-        if status:
-            query = query.where(Order.status == status)
-        
-        if customer_id:
-            query = query.where(Order.customer_id == customer_id)
-        
-        if search:
-            search_pattern = f"%{search.lower()}%"
-            query = query.where(
-                (Order.order_number.ilike(search_pattern)) |
-                (Order.description.ilike(search_pattern)) |
-                (Customer.name.ilike(search_pattern))|
-                (Order.status.ilike(search_pattern))
-            )
+        filters = OrderService.list_filters(status, customer_id, search)
+        if filters:
+            query = query.where(and_(*filters))
         
-        query = query.order_by(Order.created_at.desc()).offset(skip).limit(limit)
+        query = apply_keyset(query, [Order.created_at, Order.id], cursor)
+        query = query.order_by(Order.created_at.desc(), Order.id.desc()).offset(skip).limit(limit)
         result = await db.execute(query)
-        orders = result.scalars().all()
         
-        return [OrderResponse.model_validate(order) for order in orders]
+        return ORDER_LIST_ADAPTER.validate_python([_nest_row(row) for row in result.mappings()])
     
     @staticmethod
     async def update_order(
@@ -108,37 +254,172 @@ class OrderService:
         order_id: str,
         order_update: OrderUpdate
     ) -> OrderResponse:
-        """Update order details"""
+        """Update order details
+        
+        A single UPDATE ... FROM locks the current row in a subquery so the
+        old status, amount and service come back next to the new values,
+        along with the customer and service rows. The status transition is
+        decided in SQL and queues the customer's notification.
+        """
+        orders = Order.__table__
+        update_data = order_update.model_dump(exclude_unset=True)
+        if update_data.get("status", OrderStatus.PENDING) is None:
+            del update_data["status"]
+        values = {**update_data, "updated_at": datetime.utcnow()}
+        if "status" in values:
+            values["status"] = OrderStatus(values["status"])
+        service_id = values.get("service_id", orders.c.service_id)
+        if update_data.keys() & SEARCH_FIELDS:
+            values["search_document"] = OrderSearchService.document(
+                description=literal(values["description"], orders.c.description.type)
+                if "description" in values else orders.c.description
+            )
         
+        previous = orders.alias("previous")
+        old = (
+            select(
+                previous.c.id,
+                previous.c.status.label("old_status"),
+                previous.c.amount.label("old_amount"),
+                previous.c.service_id.label("old_service_id")
+            )
+            .where(previous.c.id == order_id)
+            .with_for_update()
+            .subquery("old")
+        )
         result = await db.execute(
-            select(Order)
-            .options(selectinload(Order.customer), selectinload(Order.service))
-            .where(Order.id == order_id)
+            update(orders)
+            .where(
+                orders.c.id == old.c.id,
+                Customer.id == orders.c.customer_id,
+                Service.id == service_id
+            )
+            .values(values)
+            .returning(
+                *[orders.c[field].label(field) for field in ORDER_FIELDS],
+                *RELATED_COLUMNS,
+                old.c.old_status,
+                old.c.old_amount,
+                old.c.old_service_id,
+                old.c.old_status.is_distinct_from(orders.c.status).label("status_changed")
+            )
         )
-        order = result.scalar_one_or_none()
+        row = result.mappings().one_or_none()
+        if row is None:
+            current = (await db.execute(
+                select(Order.customer_id, Order.service_id).where(Order.id == order_id)
+            )).one_or_none()
+            # Release the row lock taken by the UPDATE's subquery before answering
+            await db.rollback()
+            if current is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Order not found"
+                )
+            try:
+                await OrderService._verify_relations(
+                    db, current.customer_id, update_data.get("service_id", current.service_id)
+                )
+            finally:
+                await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Customer or service changed while updating the order, please retry"
+            )
         
-        if not order:
+        updated = OrderResponse.model_validate(_nest_row(row))
+        before = (
+            (updated.created_at.date(), OrderStatus(row["old_status"]), row["old_service_id"]),
+            row["old_amount"] or 0.0
+        )
+        await OrderStatsService.record_changed(db, before, updated)
+        await CustomerStatsService.record_changes(db, [
+            (CustomerStatsService.snapshot(updated.customer_id, row["old_status"], row["old_amount"]), updated)
+        ])
+        if row["status_changed"]:
+            NotificationService.order_status_changed(db, updated)
+        await db.commit()
+        stats_cache.invalidate("orders")
+        
+        return updated
+    
+    @staticmethod
+    async def update_orders_status(db: AsyncSession, payload: OrderBulkStatusUpdate) -> List[OrderResponse]:
+        """Move many orders to one status with a single UPDATE ... WHERE id = ANY(...)
+        
+        Rows are locked in id order so concurrent batches cannot deadlock.
+        Orders whose status actually changed move in the rollup with one
+        upsert and get one queued notification per customer. Any unknown
+        id rolls the whole batch back with a 404.
+        """
+        orders = Order.__table__
+        order_ids = list(dict.fromkeys(payload.order_ids))
+        new_status = OrderStatus(payload.status)
+        values = {"status": new_status, "updated_at": datetime.utcnow()}
+        if payload.progress_notes is not None:
+            values["progress_notes"] = payload.progress_notes
+        
+        previous = orders.alias("previous")
+        old = (
+            select(previous.c.id, previous.c.status.label("old_status"))
+            .where(previous.c.id == any_(literal(order_ids, ARRAY(String))))
+            .order_by(previous.c.id)
+            .with_for_update()
+            .subquery("old")
+        )
+        result = await db.execute(
+            update(orders)
+            .where(
+                orders.c.id == old.c.id,
+                Customer.id == orders.c.customer_id,
+                Service.id == orders.c.service_id
+            )
+            .values(values)
+            .returning(
+                *[orders.c[field].label(field) for field in ORDER_FIELDS],
+                *RELATED_COLUMNS,
+                old.c.old_status,
+                old.c.old_status.is_distinct_from(orders.c.status).label("status_changed")
+            )
+        )
+        rows = result.mappings().all()
+        
+        missing = set(order_ids) - {row["id"] for row in rows}
+        if missing:
+            await db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Order not found"
+                detail=f"Order not found: {', '.join(sorted(missing))}"
             )
         
-        update_data = order_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(order, field, value)
-        
+        updated = [OrderResponse.model_validate(_nest_row(row)) for row in rows]
+        moves = [
+            (((order.created_at.date(), OrderStatus(row["old_status"]), order.service_id), order.amount or 0.0), order)
+            for order, row in zip(updated, rows)
+            if row["status_changed"]
+        ]
+        await OrderStatsService.record_changes(db, moves)
+        await CustomerStatsService.record_changes(db, [
+            (CustomerStatsService.snapshot(order.customer_id, row["old_status"], order.amount), order)
+            for order, row in zip(updated, rows)
+            if row["status_changed"]
+        ])
+        NotificationService.orders_status_changed(db, [order for _, order in moves])
         await db.commit()
-        await db.refresh(order)
+        stats_cache.invalidate("orders")
         
-        return OrderResponse.model_validate(order)
+        order_index = {order_id: i for i, order_id in enumerate(order_ids)}
+        return sorted(updated, key=lambda order: order_index[order.id])
     
     @staticmethod
     async def delete_order(db: AsyncSession, order_id: str) -> bool:
         """Delete order"""
         result = await db.execute(
-            select(Order).where(Order.id == order_id)
+            delete(Order.__table__)
+            .where(Order.__table__.c.id == order_id)
+            .returning(Order.created_at, Order.status, Order.service_id, Order.customer_id, Order.amount)
         )
-        order = result.scalar_one_or_none()
+        order = result.one_or_none()
         
         if not order:
             raise HTTPException(
@@ -146,8 +427,10 @@ class OrderService:
                 detail="Order not found"
             )
         
-        await db.delete(order)
+        await OrderStatsService.record_deleted(db, [order])
+        await CustomerStatsService.record_deleted(db, [order])
         await db.commit()
+        stats_cache.invalidate("orders")
         return True
     
     @staticmethod
@@ -178,8 +461,16 @@ class OrderService:
             start_date = datetime(year, 1, 1)
             end_date = datetime(year, 12, 31, 23, 59, 59)
         
-        # Get main statistics
-        stats = await OrderService._calculate_statistics(db, start_date, end_date)
+        # Current and previous period are aggregated in a single statement
+        compare = bool(include_comparison and start_date and end_date)
+        prev_start, prev_end = (
+            OrderService._get_previous_period(start_date, end_date) if compare else (None, None)
+        )
+        rollup = OrderService._can_use_rollup(start_date, end_date, prev_start, prev_end)
+        current_stats, previous_stats = await OrderService._calculate_statistics(
+            db, start_date, end_date, prev_start, prev_end, rollup
+        )
+        stats = dict(current_stats)
         
         # Add filter info
         stats["filters"] = {
@@ -193,19 +484,15 @@ class OrderService:
         # Add monthly breakdown if requested
         if include_monthly_breakdown:
             stats["monthly_breakdown"] = await OrderService._get_monthly_breakdown(
-                db, start_date, end_date, year
+                db, start_date, end_date, year, rollup
             )
         
         # Add comparison with previous period if requested
-        if include_comparison and start_date and end_date:
-            stats["comparison"] = await OrderService._get_comparison(
-                db, start_date, end_date
-            )
+        if compare:
+            stats["comparison"] = OrderService._get_comparison(previous_stats, current_stats)
         
         # Add additional metrics
-        stats["metrics"] = await OrderService._get_additional_metrics(
-            db, start_date, end_date
-        )
+        stats["metrics"] = OrderService._get_additional_metrics(current_stats)
         
         return stats
     
@@ -236,159 +523,277 @@ class OrderService:
         return start, end
     
     @staticmethod
-    async def _calculate_statistics(
-        db: AsyncSession,
+    def _get_previous_period(start_date: datetime, end_date: datetime) -> tuple[datetime, datetime]:
+        """Get the period of the same length ending just before start_date"""
+        period_length = end_date - start_date
+        prev_start = start_date - period_length - timedelta(seconds=1)
+        prev_end = start_date - timedelta(seconds=1)
+        return prev_start, prev_end
+    
+    @staticmethod
+    def _can_use_rollup(*bounds: Optional[datetime]) -> bool:
+        """Check whether the ranges can be answered from order_daily_stats"""
+        if not settings.ORDER_STATS_FROM_ROLLUP:
+            return False
+        return all(
+            OrderStatsService.day_bounds(start, end) is not None
+            for start, end in zip(bounds[::2], bounds[1::2])
+        )
+    
+    @staticmethod
+    def _date_filters(
         start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> dict:
-        """Calculate basic order statistics"""
-        
-        # Build filters
+        end_date: Optional[datetime],
+        rollup: bool = False
+    ) -> list:
+        """Build created_at range filters, or day filters on the rollup"""
         filters = []
+        if rollup:
+            start_day, end_day = OrderStatsService.day_bounds(start_date, end_date)
+            if start_day:
+                filters.append(OrderDailyStat.day >= start_day)
+            if end_day:
+                filters.append(OrderDailyStat.day < end_day)
+            return filters
         if start_date:
             filters.append(Order.created_at >= start_date)
         if end_date:
             filters.append(Order.created_at <= end_date)
-        
-        # Count by status
-        status_query = select(
-            Order.status,
-            func.count(Order.id).label('count')
-        ).group_by(Order.status)
-        
-        if filters:
-            status_query = status_query.where(and_(*filters))
-        
-        status_counts = await db.execute(status_query)
-        
-        stats = {
-            "total": 0,
-            "pending": 0,
-            "in_progress": 0,
-            "completed": 0,
-            "cancelled": 0,
-            "total_revenue": 0.0,
-            "average_order_value": 0.0
-        }
-        
-        for status, count in status_counts:
-            stats["total"] += count
-            stats[status.value] = count
-        
-        # Calculate revenue and average from completed orders
-        revenue_query = select(
-            func.sum(Order.amount).label('total'),
-            func.avg(Order.amount).label('average'),
-            func.count(Order.id).label('count')
-        ).where(Order.status == OrderStatus.COMPLETED)
-        
-        if filters:
-            revenue_query = revenue_query.where(and_(*filters))
-        
-        revenue_result = await db.execute(revenue_query)
-        revenue_data = revenue_result.first()
-        
-        if revenue_data:
-            stats["total_revenue"] = float(revenue_data.total) if revenue_data.total else 0.0
-            stats["average_order_value"] = float(revenue_data.average) if revenue_data.average else 0.0
-            stats["completed_orders_count"] = revenue_data.count or 0
-        
+        return filters
+    
+    @staticmethod
+    def _aggregate_source(rollup: bool) -> tuple:
+        """Date column, status column, order count and amount sum to aggregate"""
+        if rollup:
+            return (
+                OrderDailyStat.day,
+                OrderDailyStat.status,
+                func.sum(OrderDailyStat.order_count),
+                func.sum(OrderDailyStat.revenue)
+            )
+        return Order.created_at, Order.status, func.count(Order.id), func.sum(Order.amount)
+    
+    @staticmethod
+    def _period_columns(prefix: str, condition, rollup: bool = False) -> list:
+        """Per-status counts and completed revenue for rows matching condition"""
+        _, status_column, order_count, amount_sum = OrderService._aggregate_source(rollup)
+        columns = [order_count.filter(condition).label(f"{prefix}_total")]
+        for order_status in OrderStatus:
+            columns.append(
+                order_count
+                .filter(and_(condition, status_column == order_status))
+                .label(f"{prefix}_{order_status.value}")
+            )
+        columns.append(
+            amount_sum
+            .filter(and_(condition, status_column == OrderStatus.COMPLETED))
+            .label(f"{prefix}_revenue")
+        )
+        return columns
+    
+    @staticmethod
+    def _stats_from_row(row, prefix: str) -> dict:
+        """Shape one period of the aggregate row into the statistics dict"""
+        # Rollup counts are SUMs, which Postgres returns as bigint or numeric
+        stats = {"total": int(row[f"{prefix}_total"] or 0)}
+        for order_status in OrderStatus:
+            stats[order_status.value] = int(row[f"{prefix}_{order_status.value}"] or 0)
+        
+        # Revenue and average are taken from completed orders
+        revenue = float(row[f"{prefix}_revenue"] or 0.0)
+        completed = stats[OrderStatus.COMPLETED.value]
+        stats["total_revenue"] = revenue
+        stats["average_order_value"] = revenue / completed if completed else 0.0
+        stats["completed_orders_count"] = completed
         return stats
     
+    @staticmethod
+    async def _calculate_statistics(
+        db: AsyncSession,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        prev_start: Optional[datetime] = None,
+        prev_end: Optional[datetime] = None,
+        rollup: bool = False
+    ) -> tuple[dict, Optional[dict]]:
+        """Calculate order statistics for a period and, optionally, the previous one
+        
+        Both periods come from one aggregate using FILTER clauses, scanning
+        only rows that fall in either range. With rollup the rows are daily
+        buckets from order_daily_stats rather than orders.
+        """
+        current = and_(true(), *OrderService._date_filters(start_date, end_date, rollup))
+        columns = OrderService._period_columns("cur", current, rollup)
+        scanned = current
+        
+        compare = prev_start is not None and prev_end is not None
+        if compare:
+            previous = and_(*OrderService._date_filters(prev_start, prev_end, rollup))
+            columns += OrderService._period_columns("prev", previous, rollup)
+            scanned = or_(current, previous)
+        
+        query = select(*columns).where(scanned)
+        if rollup:
+            query = query.select_from(OrderDailyStat)
+        result = await db.execute(query)
+        row = result.mappings().one()
+        
+        current_stats = OrderService._stats_from_row(row, "cur")
+        previous_stats = OrderService._stats_from_row(row, "prev") if compare else None
+        return current_stats, previous_stats
+    
     @staticmethod
     async def _get_monthly_breakdown(
         db: AsyncSession,
         start_date: Optional[datetime],
         end_date: Optional[datetime],
-        year: Optional[int]
+        year: Optional[int],
+        rollup: bool = False
     ) -> list[dict]:
         """Get monthly breakdown of orders"""
+        default_year = year or datetime.now().year
+        first_month = datetime(start_date.year, start_date.month, 1) if start_date else datetime(default_year, 1, 1)
+        last_month = datetime(end_date.year, end_date.month, 1) if end_date else datetime(default_year, 12, 1)
         
-        # Determine year range
-        if year:
-            years = [year]
-        elif start_date and end_date:
-            years = list(range(start_date.year, end_date.year + 1))
-        else:
-            years = [datetime.now().year]
+        rows = await OrderService._query_timeseries(
+            db, "month", first_month, last_month,
+            OrderService._date_filters(start_date, end_date, rollup), rollup
+        )
         
         monthly_data = []
-        
-        for current_year in years:
-            # Query for monthly data
-            monthly_query = select(
-                extract('month', Order.created_at).label('month'),
-                Order.status,
-                func.count(Order.id).label('count'),
-                func.sum(
-                    case(
-                        (Order.status == OrderStatus.COMPLETED, Order.amount),
-                        else_=0
-                    )
-                ).label('revenue')
-            ).where(
-                extract('year', Order.created_at) == current_year
-            ).group_by('month', Order.status)
-            
-            # Apply date filters if provided
-            if start_date:
-                monthly_query = monthly_query.where(Order.created_at >= start_date)
-            if end_date:
-                monthly_query = monthly_query.where(Order.created_at <= end_date)
-            
-            results = await db.execute(monthly_query)
-            
-            # Organize data by month
-            months_dict = {}
-            for month_num in range(1, 13):
-                month_date = datetime(current_year, month_num, 1)
-                
-                # Skip months outside date range
-                if start_date and month_date < datetime(start_date.year, start_date.month, 1):
-                    continue
-                if end_date and month_date > datetime(end_date.year, end_date.month, 1):
-                    continue
-                
-                months_dict[month_num] = {
-                    "year": current_year,
-                    "month": month_num,
-                    "month_name": month_date.strftime('%B'),
-                    "total": 0,
-                    "pending": 0,
-                    "in_progress": 0,
-                    "completed": 0,
-                    "cancelled": 0,
-                    "revenue": 0.0
-                }
-            
-            # Fill in actual data
-            for month, status, count, revenue in results:
-                month_int = int(month)
-                if month_int in months_dict:
-                    months_dict[month_int]["total"] += count
-                    months_dict[month_int][status.value] = count
-                    if revenue:
-                        months_dict[month_int]["revenue"] = float(revenue)
-            
-            monthly_data.extend(months_dict.values())
+        for row in rows:
+            month_date = row["bucket"]
+            month_stats = {
+                "year": month_date.year,
+                "month": month_date.month,
+                "month_name": month_date.strftime('%B'),
+                "total": 0
+            }
+            for order_status in OrderStatus:
+                month_stats[order_status.value] = row[f"{order_status.value}_count"]
+                month_stats["total"] += row[f"{order_status.value}_count"]
+            month_stats["revenue"] = float(row[f"{OrderStatus.COMPLETED.value}_revenue"])
+            monthly_data.append(month_stats)
         
         return monthly_data
     
     @staticmethod
-    async def _get_comparison(
+    async def get_order_timeseries(
         db: AsyncSession,
-        start_date: datetime,
-        end_date: datetime
+        granularity: str = "month",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
     ) -> dict:
-        """Compare current period with previous period"""
+        """Get per-status order counts and revenue per time bucket as column arrays"""
+        if granularity not in TIMESERIES_STEPS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Granularity must be one of: {', '.join(TIMESERIES_STEPS)}"
+            )
         
-        period_length = end_date - start_date
-        prev_start = start_date - period_length - timedelta(seconds=1)
-        prev_end = start_date - timedelta(seconds=1)
+        end_date = end_date or datetime.now().date()
+        start_date = start_date or end_date - timedelta(days=365)
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must not be after end_date"
+            )
+        if (end_date - start_date).days // TIMESERIES_BUCKET_DAYS[granularity] > MAX_TIMESERIES_BUCKETS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Range too large for {granularity} granularity"
+            )
+        
+        # Whole days, so the rollup can always answer when enabled
+        range_start = datetime.combine(start_date, time(0))
+        range_end = datetime.combine(end_date, time(23, 59, 59))
+        rollup = OrderService._can_use_rollup(range_start, range_end)
+        rows = await OrderService._query_timeseries(
+            db, granularity, range_start, range_end,
+            OrderService._date_filters(range_start, range_end, rollup), rollup
+        )
+        
+        by_status = {
+            order_status.value: {
+                "count": [row[f"{order_status.value}_count"] for row in rows],
+                "revenue": [float(row[f"{order_status.value}_revenue"]) for row in rows]
+            }
+            for order_status in OrderStatus
+        }
+        return {
+            "granularity": granularity,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "buckets": [row["bucket"].date().isoformat() for row in rows],
+            "total": [sum(counts) for counts in zip(*(entry["count"] for entry in by_status.values()))],
+            "revenue": by_status[OrderStatus.COMPLETED.value]["revenue"],
+            "by_status": by_status
+        }
+    
+    @staticmethod
+    async def _query_timeseries(
+        db: AsyncSession,
+        granularity: str,
+        first_bucket: datetime,
+        last_bucket: datetime,
+        filters: list,
+        rollup: bool = False
+    ) -> list:
+        """One row per bucket from first_bucket to last_bucket, zero-filled
+        
+        Buckets come from generate_series and are left joined to the
+        date_trunc aggregate, so every bucket is returned in one statement.
+        """
+        date_column, status_column, order_count, amount_sum = OrderService._aggregate_source(rollup)
+        # Granularity is whitelisted, so it can be inlined; a bound parameter
+        # would make the SELECT and GROUP BY expressions differ
+        unit = literal_column(f"'{granularity}'")
+        step = literal_column(f"interval '{TIMESERIES_STEPS[granularity]}'")
+        
+        bucket = func.date_trunc(unit, cast(date_column, DateTime))
+        aggregate = select(
+            bucket.label("bucket"),
+            status_column.label("status"),
+            order_count.label("count"),
+            amount_sum.label("revenue")
+        ).group_by(bucket, status_column)
+        if rollup:
+            aggregate = aggregate.select_from(OrderDailyStat)
+        if filters:
+            aggregate = aggregate.where(and_(*filters))
+        aggregate = aggregate.subquery("aggregate")
+        
+        series = func.generate_series(
+            func.date_trunc(unit, cast(first_bucket, DateTime)),
+            func.date_trunc(unit, cast(last_bucket, DateTime)),
+            step
+        ).table_valued("bucket").render_derived(name="series")
+        
+        # SUM of counts is numeric in Postgres, so cast back to integer
+        columns = [series.c.bucket]
+        for order_status in OrderStatus:
+            matches = aggregate.c.status == order_status
+            columns.append(
+                cast(func.coalesce(func.sum(aggregate.c.count).filter(matches), 0), Integer)
+                .label(f"{order_status.value}_count")
+            )
+            columns.append(
+                func.coalesce(func.sum(aggregate.c.revenue).filter(matches), 0.0)
+                .label(f"{order_status.value}_revenue")
+            )
         
-        # Get previous period stats
-        previous_stats = await OrderService._calculate_statistics(db, prev_start, prev_end)
-        current_stats = await OrderService._calculate_statistics(db, start_date, end_date)
+        query = (
+            select(*columns)
+            .select_from(series.outerjoin(aggregate, aggregate.c.bucket == series.c.bucket))
+            .group_by(series.c.bucket)
+            .order_by(series.c.bucket)
+        )
+        result = await db.execute(query)
+        return result.mappings().all()
+    
+    @staticmethod
+    def _get_comparison(previous_stats: dict, current_stats: dict) -> dict:
+        """Compare current period with previous period"""
         
         def calc_change(prev: float, curr: float) -> dict:
             if prev == 0:
@@ -414,52 +819,17 @@ class OrderService:
         }
     
     @staticmethod
-    async def _get_additional_metrics(
-        db: AsyncSession,
-        start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> dict:
+    def _get_additional_metrics(stats: dict) -> dict:
         """Calculate additional useful metrics"""
-        
-        filters = []
-        if start_date:
-            filters.append(Order.created_at >= start_date)
-        if end_date:
-            filters.append(Order.created_at <= end_date)
-        
-        # Completion rate
-        total_query = select(func.count(Order.id))
-        if filters:
-            total_query = total_query.where(and_(*filters))
-        
-        total_result = await db.execute(total_query)
-        total_orders = total_result.scalar_one_or_none() or 0
-        
-        completed_query = select(func.count(Order.id)).where(
-            Order.status == OrderStatus.COMPLETED
-        )
-        if filters:
-            completed_query = completed_query.where(and_(*filters))
-        
-        completed_result = await db.execute(completed_query)
-        completed_orders = completed_result.scalar_one_or_none() or 0
+        total_orders = stats["total"]
+        completed_orders = stats[OrderStatus.COMPLETED.value]
+        cancelled_orders = stats[OrderStatus.CANCELLED.value]
         
         completion_rate = (completed_orders / total_orders * 100) if total_orders > 0 else 0.0
-        
-        # Cancellation rate
-        cancelled_query = select(func.count(Order.id)).where(
-            Order.status == OrderStatus.CANCELLED
-        )
-        if filters:
-            cancelled_query = cancelled_query.where(and_(*filters))
-        
-        cancelled_result = await db.execute(cancelled_query)
-        cancelled_orders = cancelled_result.scalar_one_or_none() or 0
-        
         cancellation_rate = (cancelled_orders / total_orders * 100) if total_orders > 0 else 0.0
         
         return {
             "completion_rate": round(completion_rate, 2),
             "cancellation_rate": round(cancellation_rate, 2),
             "in_progress_orders": total_orders - completed_orders - cancelled_orders
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,166 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional
+from sqlalchemy import Date, and_, cast, delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.postgress_model import Order, OrderDailyStat, OrderStatus
+
+# Rollup bucket: (creation day, status, service_id)
+StatKey = tuple[date, OrderStatus, str]
+
+
+class OrderStatsService:
+    @staticmethod
+    def snapshot(order: Order) -> tuple[StatKey, float]:
+        """Rollup key and amount of an order, taken before it changes"""
+        key = (order.created_at.date(), OrderStatus(order.status), order.service_id)
+        return key, order.amount or 0.0
+
+    @staticmethod
+    async def apply(db: AsyncSession, changes: Iterable[tuple[StatKey, int, float]]) -> None:
+        """Add (key, count, revenue) deltas to the rollup in the caller's transaction
+
+        Deltas for the same key are merged first so one upsert statement
+        never touches a row twice.
+        """
+        merged = defaultdict(lambda: [0, 0.0])
+        for key, count, revenue in changes:
+            merged[key][0] += count
+            merged[key][1] += revenue
+
+        rows = [
+            {"day": day, "status": order_status, "service_id": service_id,
+             "order_count": count, "revenue": revenue}
+            for (day, order_status, service_id), (count, revenue) in merged.items()
+            if count or revenue
+        ]
+        if not rows:
+            return
+
+        stmt = pg_insert(OrderDailyStat).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OrderDailyStat.day, OrderDailyStat.status, OrderDailyStat.service_id],
+            set_={
+                "order_count": OrderDailyStat.order_count + stmt.excluded.order_count,
+                "revenue": OrderDailyStat.revenue + stmt.excluded.revenue
+            }
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    async def record_created(db: AsyncSession, orders: Iterable[Order]) -> None:
+        """Count newly created orders"""
+        changes = []
+        for order in orders:
+            key, amount = OrderStatsService.snapshot(order)
+            changes.append((key, 1, amount))
+        await OrderStatsService.apply(db, changes)
+
+    @staticmethod
+    async def record_deleted(db: AsyncSession, orders: Iterable[Order]) -> None:
+        """Remove deleted orders from the rollup"""
+        changes = []
+        for order in orders:
+            key, amount = OrderStatsService.snapshot(order)
+            changes.append((key, -1, -amount))
+        await OrderStatsService.apply(db, changes)
+
+    @staticmethod
+    async def record_changed(
+        db: AsyncSession,
+        before: tuple[StatKey, float],
+        order: Order
+    ) -> None:
+        """Move an order between buckets after a status, service or amount change"""
+        await OrderStatsService.record_changes(db, [(before, order)])
+
+    @staticmethod
+    async def record_changes(
+        db: AsyncSession,
+        changes: Iterable[tuple[tuple[StatKey, float], Order]]
+    ) -> None:
+        """Move several orders given as (before, order) pairs with one upsert"""
+        deltas = []
+        for (old_key, old_amount), order in changes:
+            new_key, new_amount = OrderStatsService.snapshot(order)
+            if (old_key, old_amount) == (new_key, new_amount):
+                continue
+            deltas.append((old_key, -1, -old_amount))
+            deltas.append((new_key, 1, new_amount))
+        await OrderStatsService.apply(db, deltas)
+
+    @staticmethod
+    def day_bounds(
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Optional[tuple[Optional[date], Optional[date]]]:
+        """Translate a created_at range into [start_day, end_day) for the rollup
+
+        Returns None when a boundary does not fall within a second of
+        midnight, in which case the range cannot be answered from whole days.
+        """
+        def to_day(moment: Optional[datetime]) -> Optional[date]:
+            if moment is None:
+                return None
+            if moment.time() == time(0):
+                return moment.date()
+            if moment.time() >= time(23, 59, 59):
+                return moment.date() + timedelta(days=1)
+            raise ValueError("not day aligned")
+
+        try:
+            return to_day(start_date), to_day(end_date)
+        except ValueError:
+            return None
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, start_day: date, end_day: date) -> int:
+        """Recompute rollup rows for days in [start_day, end_day) from orders
+
+        Takes a SHARE lock on orders so concurrent writes wait for the chunk
+        to commit instead of being double counted or lost.
+        """
+        await db.execute(text("LOCK TABLE orders IN SHARE MODE"))
+        await db.execute(
+            delete(OrderDailyStat).where(
+                OrderDailyStat.day >= start_day,
+                OrderDailyStat.day < end_day
+            )
+        )
+
+        day = cast(Order.created_at, Date)
+        source = select(
+            day,
+            Order.status,
+            Order.service_id,
+            func.count(Order.id),
+            func.sum(Order.amount)
+        ).where(
+            and_(
+                Order.created_at >= datetime.combine(start_day, time(0)),
+                Order.created_at < datetime.combine(end_day, time(0)),
+                Order.status.isnot(None)
+            )
+        ).group_by(day, Order.status, Order.service_id)
+
+        result = await db.execute(
+            insert(OrderDailyStat).from_select(
+                ["day", "status", "service_id", "order_count", "revenue"],
+                source
+            )
+        )
+        return result.rowcount
+
+    @staticmethod
+    async def order_date_range(db: AsyncSession) -> Optional[tuple[date, date]]:
+        """First and last order creation day, or None when there are no orders"""
+        result = await db.execute(
+            select(func.min(Order.created_at), func.max(Order.created_at))
+        )
+        first, last = result.one()
+        if first is None:
+            return None
+        return first.date(), last.date()
+
@@ -0,0 +1,116 @@
+import random
+from datetime import datetime, timedelta
+from typing import Iterable
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.settings import settings
+from app.models.postgress_model import OutboxMessage, OutboxStatus
+
+# Recipient-facing methods the dispatcher may call, per channel
+OUTBOX_TEMPLATES = {
+    "email": {
+        "send_order_confirmation", "send_orders_confirmation", "send_order_update",
+        "send_orders_update", "notify_admin_contact_form"
+    },
+    "sms": {
+        "send_order_notification", "send_orders_received", "send_orders_update",
+        "notify_admin_contact_form"
+    },
+}
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Delay before the next try after attempts failures, doubling with jitter"""
+    delay = min(
+        settings.OUTBOX_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.OUTBOX_MAX_BACKOFF_SECONDS
+    )
+    return delay * random.uniform(0.8, 1.2)
+
+
+class OutboxService:
+    @staticmethod
+    def enqueue(db: AsyncSession, channel: str, template: str, **payload) -> None:
+        """Queue a notification in the caller's transaction
+
+        Nothing is sent unless the transaction commits; payload must be
+        JSON serialisable keyword arguments for the template method.
+        """
+        if template not in OUTBOX_TEMPLATES.get(channel, ()):
+            raise ValueError(f"Unknown {channel} template: {template}")
+        db.add(OutboxMessage(channel=channel, template=template, payload=payload))
+
+    @staticmethod
+    async def claim(db: AsyncSession, batch_size: int, lease_seconds: int) -> list:
+        """Lease up to batch_size due messages and count the attempt
+
+        SKIP LOCKED lets several dispatchers claim disjoint batches. The
+        lease is stored in available_at, so no lock is held while sending
+        and a message held by a crashed dispatcher is retried once it expires.
+        """
+        now = datetime.utcnow()
+        due = (
+            select(OutboxMessage.id)
+            .where(
+                OutboxMessage.status == OutboxStatus.PENDING,
+                OutboxMessage.available_at <= now
+            )
+            .order_by(OutboxMessage.available_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(due))
+            .values(
+                attempts=OutboxMessage.attempts + 1,
+                available_at=now + timedelta(seconds=lease_seconds)
+            )
+            .returning(
+                OutboxMessage.id,
+                OutboxMessage.channel,
+                OutboxMessage.template,
+                OutboxMessage.payload,
+                OutboxMessage.attempts
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.all()
+
+    @staticmethod
+    async def record_results(
+        db: AsyncSession,
+        results: Iterable[tuple],
+        max_attempts: int
+    ) -> None:
+        """Store the outcome of claimed messages given as (message, error or None)
+
+        Failures are rescheduled with backoff until max_attempts, then
+        marked failed.
+        """
+        now = datetime.utcnow()
+        sent = []
+        for message, error in results:
+            if error is None:
+                sent.append(message.id)
+                continue
+            values = {"last_error": error[:2000]}
+            if message.attempts >= max_attempts:
+                values["status"] = OutboxStatus.FAILED
+            else:
+                values["available_at"] = now + timedelta(seconds=backoff_seconds(message.attempts))
+            await db.execute(
+                update(OutboxMessage)
+                .where(OutboxMessage.id == message.id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        if sent:
+            await db.execute(
+                update(OutboxMessage)
+                .where(OutboxMessage.id.in_(sent))
+                .values(status=OutboxStatus.SENT, sent_at=now, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
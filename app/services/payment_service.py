@@ -11,6 +11,8 @@ import os
 
 from app.models.postgress_model import Payment, PaymentType, PaymentStatus, Student
 from app.schemas.payments import PaymentRequest
+from app.utils.cache import stats_cache
+from app.utils.pagination import apply_keyset
 
 PAYSTACK_SECRET_KEY = os.getenv("Paystack")
 
@@ -119,6 +121,7 @@ class PaymentService:
             
             db.add(payment)
             await db.commit()
+            stats_cache.invalidate("payments")
             await db.refresh(payment)
             
             return {
@@ -206,6 +209,7 @@ class PaymentService:
             payment.updated_at = datetime.utcnow()
             
             await db.commit()
+            stats_cache.invalidate("payments")
             await db.refresh(payment)
             
             return {
@@ -276,10 +280,11 @@ class PaymentService:
         skip: int = 0,
         limit: int = 100,
         status_filter: Optional[PaymentStatus] = None,
-        payment_type_filter: Optional[PaymentType] = None
+        payment_type_filter: Optional[PaymentType] = None,
+        cursor: Optional[str] = None
     ) -> List[Payment]:
         """Get all payments (Admin only)"""
-        query = select(Payment).order_by(desc(Payment.created_at))
+        query = select(Payment).order_by(desc(Payment.created_at), desc(Payment.id))
         
         filters = []
         if status_filter:
@@ -290,6 +295,7 @@ class PaymentService:
         if filters:
             query = query.where(and_(*filters))
         
+        query = apply_keyset(query, [Payment.created_at, Payment.id], cursor)
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
         return result.scalars().all()
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+import hashlib
+import secrets
+import uuid
+
+from app.config.settings import settings
+from app.models.postgress_model import RefreshToken, User
+
+
+class RefreshTokenService:
+    @staticmethod
+    def _digest(token: str) -> str:
+        """Return the SHA-256 digest stored in place of the raw token"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def issue(db: AsyncSession, user_id: str, family_id: Optional[str] = None) -> str:
+        """Add a new refresh token to the session and return its raw value"""
+        token = secrets.token_urlsafe(48)
+        db.add(RefreshToken(
+            user_id=str(user_id),
+            token_hash=RefreshTokenService._digest(token),
+            family_id=family_id or str(uuid.uuid4()),
+            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        ))
+        return token
+
+    @staticmethod
+    async def create(db: AsyncSession, user_id: str) -> str:
+        """Start a new refresh token family for a fresh login"""
+        token = RefreshTokenService.issue(db, user_id)
+        await db.commit()
+        return token
+
+    @staticmethod
+    async def rotate(db: AsyncSession, token: str):
+        """Consume a refresh token and issue its successor
+
+        Returns ``(user, new_token)`` where ``user`` exposes the fields
+        ``AuthService.create_user_access_token`` reads: ``id``, ``email``,
+        ``full_name``, ``role``, ``is_active`` and ``token_version``. Presenting an already-used token revokes the whole
+        family, since it means the token was replayed.
+        """
+        now = datetime.utcnow()
+        digest = RefreshTokenService._digest(token)
+
+        # Revoke and load the owner in one statement via the token_hash index
+        result = await db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == digest,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+                RefreshToken.user_id == User.id,
+                User.is_active == True
+            )
+            .values(revoked_at=now)
+            .returning(
+                RefreshToken.user_id.label("id"),
+                RefreshToken.family_id,
+                User.email,
+                User.full_name,
+                User.role,
+                User.is_active,
+                User.token_version
+            )
+            .execution_options(synchronize_session=False)
+        )
+        user = result.first()
+
+        if user is None:
+            await RefreshTokenService._revoke_replayed_family(db, digest, now)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        new_token = RefreshTokenService.issue(db, user.id, user.family_id)
+        await db.commit()
+        return user, new_token
+
+    @staticmethod
+    async def _revoke_replayed_family(db: AsyncSession, digest: str, now: datetime) -> None:
+        """Revoke every token in the family of a reused token"""
+        result = await db.execute(
+            select(RefreshToken.family_id).where(
+                RefreshToken.token_hash == digest,
+                RefreshToken.revoked_at.is_not(None)
+            )
+        )
+        family_id = result.scalar_one_or_none()
+        if family_id is None:
+            await db.rollback()
+            return
+
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def revoke(db: AsyncSession, token: str) -> None:
+        """Revoke the family of a refresh token (logout)"""
+        now = datetime.utcnow()
+        family = (
+            select(RefreshToken.family_id)
+            .where(RefreshToken.token_hash == RefreshTokenService._digest(token))
+            .scalar_subquery()
+        )
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
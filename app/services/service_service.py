@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.postgress_model import Service
 from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse
+from app.services.order_search_service import SERVICE_SEARCH_FIELDS, OrderSearchService
 
 class ServiceService:
     @staticmethod
@@ -82,6 +83,11 @@ class ServiceService:
         for field, value in update_data.items():
             setattr(service, field, value)
         
+        # Orders embed the service title in their search documents
+        if update_data.keys() & set(SERVICE_SEARCH_FIELDS):
+            await db.flush()
+            await OrderSearchService.refresh(db, service_id=service.id)
+        
         await db.commit()
         await db.refresh(service)
         
@@ -57,6 +57,18 @@ class SMSService:
         message = f"InnoTrend Order Update: Your order {order_number} is now {status}. Thank you for your business!"
         return await self.send_sms(phone_number, message)
     
+    async def send_orders_received(self, phone_number: str, order_numbers: List[str]) -> bool:
+        """Send one notification for several new orders"""
+        listed = ", ".join(order_numbers[:3]) + (f" and {len(order_numbers) - 3} more" if len(order_numbers) > 3 else "")
+        message = f"InnoTrend: We have received {len(order_numbers)} orders from you ({listed}). Thank you for your business!"
+        return await self.send_sms(phone_number, message)
+    
+    async def send_orders_update(self, phone_number: str, order_numbers: List[str], status: str) -> bool:
+        """Send one status notification for several orders"""
+        listed = ", ".join(order_numbers[:3]) + (f" and {len(order_numbers) - 3} more" if len(order_numbers) > 3 else "")
+        message = f"InnoTrend Order Update: {len(order_numbers)} of your orders ({listed}) are now {status}. Thank you for your business!"
+        return await self.send_sms(phone_number, message)
+    
     async def notify_admin_new_order(self, order_number: str, customer_name: str) -> bool:
         """Notify admin about new order"""
         message = f"New Order Alert! Order {order_number} from {customer_name} has been placed. Please check the dashboard."
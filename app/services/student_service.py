@@ -15,7 +15,8 @@ from app.schemas.student import (
     StudentStatusUpdate
 )
 from app.services.expenses import to_naive_utc
-from app.utils.helpers import get_password_hash, verify_password
+from app.utils.passwords import password_hasher
+from app.utils.pagination import apply_keyset
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -44,7 +45,7 @@ class StudentService:
         # Create student with hashed password
         student = Student(
             email=student_data.email,
-            password_hash=get_password_hash(student_data.password),
+            password_hash=await password_hasher.hash(student_data.password),
             full_name=student_data.full_name,
             phone=student_data.phone
         )
@@ -69,7 +70,7 @@ class StudentService:
         if not student:
             return None
         
-        if not verify_password(password, student.password_hash):
+        if not await password_hasher.verify(password, student.password_hash):
             return None
         
         if not student.is_active:
@@ -78,6 +79,9 @@ class StudentService:
                 detail="Student account is inactive"
             )
         
+        if password_hasher.needs_rehash(student.password_hash):
+            password_hasher.schedule_rehash(Student, student.id, password, student.password_hash)
+        
         return student
     
     @staticmethod
@@ -137,10 +141,11 @@ class StudentService:
         skip: int = 0,
         limit: int = 100,
         status_filter: Optional[StudentStatus] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Student]:
         """Get all students with optional filters"""
-        query = select(Student).order_by(Student.created_at.desc())
+        query = select(Student).order_by(Student.created_at.desc(), Student.id.desc())
         
         filters = []
         if status_filter:
@@ -157,6 +162,7 @@ class StudentService:
         if filters:
             query = query.where(and_(*filters))
         
+        query = apply_keyset(query, [Student.created_at, Student.id], cursor)
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
         return result.scalars().all()
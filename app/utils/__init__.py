@@ -3,9 +3,10 @@ from .helpers import (
     get_password_hash,
     create_access_token,
     decode_token,
-    generate_order_number,
     format_phone_number
 )
+from .cache import principal_cache, stats_cache, token_versions
+from .passwords import password_hasher
 from .validators import (
     validate_phone_number,
     validate_email,
@@ -17,8 +18,11 @@ __all__ = [
     "get_password_hash",
     "create_access_token",
     "decode_token",
-    "generate_order_number",
     "format_phone_number",
+    "principal_cache",
+    "stats_cache",
+    "token_versions",
+    "password_hasher",
     "validate_phone_number",
     "validate_email",
     "check_admin_permission"
@@ -0,0 +1,248 @@
+import asyncio
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from cachetools import TTLCache
+
+from app.config.settings import settings
+from app.utils.metrics import registry
+
+
+class PrincipalCache:
+    """Bounded TTL + LRU cache of authenticated principals keyed by user id.
+
+    Entries are the dicts returned by ``get_current_user``. Writes to a user
+    go through ``invalidate`` so the next request reloads from the database;
+    the TTL bounds staleness across uvicorn workers, which do not share
+    invalidations.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> Optional[dict]:
+        """Return cached principal or None"""
+        principal = self._cache.get(str(user_id))
+        if principal is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return principal
+
+    def set(self, user_id: str, principal: dict) -> None:
+        """Store principal for user"""
+        self._cache[str(user_id)] = principal
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop cached principal for user"""
+        self._cache.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        """Drop every cached principal"""
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": int(self._cache.maxsize),
+        }
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+class TokenVersionTable:
+    """Bounded TTL cache of ``users.token_version`` for claims-based authorization.
+
+    Access tokens carry the user's version at issue time and revoking
+    increments the column, so a token is accepted while its version is not
+    below the stored one. Workers reload a version after the TTL, which
+    bounds how long a revocation made elsewhere takes to be seen.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._versions = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, user_id: str) -> Optional[int]:
+        """Return the cached stored version for user or None"""
+        return self._versions.get(str(user_id))
+
+    def set(self, user_id: str, version: int) -> None:
+        """Cache the stored version for user"""
+        self._versions[str(user_id)] = version
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop the cached version for user"""
+        self._versions.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        """Drop every cached version"""
+        self._versions.clear()
+
+    @staticmethod
+    def is_current(version: int, stored: int) -> bool:
+        """Check a token version against the user's stored version"""
+        return version >= stored
+
+
+token_versions = TokenVersionTable(
+    maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+class ResultCache:
+    """TTL cache of computed results with tag invalidation and single-flight.
+
+    Results are keyed by a namespace plus normalized parameters and tagged
+    with the models they were computed from; writes call ``invalidate`` with
+    the model's tag. Concurrent misses for one key share a single
+    computation, which may outlive the caller that started it, so compute
+    must not use request-scoped resources such as the request's session.
+    Like the principal cache this is per process, so the TTL
+    bounds staleness across workers.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.enabled = ttl > 0
+        self._cache = TTLCache(maxsize=maxsize, ttl=max(ttl, 1))
+        self._tags: dict[str, set[str]] = {}
+        self._generations: dict[str, int] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return value
+
+    @staticmethod
+    def make_key(namespace: str, params: dict) -> str:
+        """Build a key that ignores parameter order and unset (None) filters"""
+        normalized = {
+            name: ResultCache._normalize(value)
+            for name, value in params.items()
+            if value is not None
+        }
+        return namespace + ":" + json.dumps(normalized, sort_keys=True, default=str)
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        params: dict,
+        tags: Iterable[str],
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached result or compute it, joining an identical in-flight call"""
+        key = self.make_key(namespace, params)
+        tags = tuple(tags)
+
+        if self.enabled and key in self._cache:
+            self.hits += 1
+            return self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            generations = [self._generations.get(tag, 0) for tag in tags]
+            task = asyncio.create_task(self._compute(key, tags, generations, compute))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        # The computation runs in its own task and every caller, the first
+        # included, waits on it through a shield, so a caller that goes away
+        # stops waiting without cancelling the result for the others
+        return await asyncio.shield(task)
+
+    async def _compute(
+        self,
+        key: str,
+        tags: tuple,
+        generations: list[int],
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        result = await compute()
+        # Skip storing if a write invalidated a tag while we were computing
+        if self.enabled and generations == [self._generations.get(tag, 0) for tag in tags]:
+            self._cache[key] = result
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+        return result
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error retrieved so asyncio does not warn when every caller left
+        if not task.cancelled():
+            task.exception()
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every result computed from the given tags"""
+        for tag in tags:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            for key in self._tags.pop(tag, ()):
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached result"""
+        self._cache.clear()
+        self._tags.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss/coalesced counters and current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "size": len(self._cache),
+            "maxsize": int(self._cache.maxsize),
+        }
+
+
+stats_cache = ResultCache(
+    maxsize=settings.STATS_CACHE_MAXSIZE,
+    ttl=settings.STATS_CACHE_TTL_SECONDS,
+)
+
+
+registry.callback(
+    "principal_cache_hits_total", "Principal cache hits",
+    lambda: [((), principal_cache.hits)], type_name="counter"
+)
+registry.callback(
+    "principal_cache_misses_total", "Principal cache misses",
+    lambda: [((), principal_cache.misses)], type_name="counter"
+)
+registry.callback(
+    "principal_cache_size", "Principals currently cached",
+    lambda: [((), len(principal_cache._cache))]
+)
+
+registry.callback(
+    "stats_cache_requests_total", "Statistics cache lookups by outcome",
+    lambda: [
+        (("hit",), stats_cache.hits),
+        (("miss",), stats_cache.misses),
+        (("coalesced",), stats_cache.coalesced),
+    ],
+    labelnames=("outcome",), type_name="counter"
+)
+registry.callback(
+    "stats_cache_size", "Statistics results currently cached",
+    lambda: [((), len(stats_cache._cache))]
+)
@@ -4,25 +4,29 @@ from typing import Optional
 from jose import JWTError, jwt 
 from passlib.context import CryptContext
 from app.config.settings import settings
-import random
-import string
 import bcrypt
+import logging
+
+logger = logging.getLogger(__name__)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
-    print("Verifying password")
-    print(hashed_password)
-    print(plain_password)
-    me = plain_password.encode("utf-8")
-    print(me)
-    return bcrypt.checkpw(me, hashed_password.encode('utf-8'))
-
-def get_password_hash(password: str) -> str:
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
     """Hash a password"""
-    hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-    return hashed.decode('utf-8') 
+    salt = bcrypt.gensalt(rounds) if rounds else bcrypt.gensalt()
+    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
+
+def get_password_cost(hashed_password: str) -> Optional[int]:
+    """Return the bcrypt work factor encoded in a hash ($2b$<cost>$...)"""
+    try:
+        return int(hashed_password.split('$')[2])
+    except (IndexError, ValueError, AttributeError):
+        return None
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
@@ -39,19 +43,11 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def decode_token(token: str) -> Optional[dict]:
     """Decode JWT token"""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        print("Decoded payload:", payload)
-        return payload
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except Exception as e:
-        print("Error decoding token:", e)
+        logger.debug("Error decoding token: %s", e)
         return None
 
-def generate_order_number() -> str:
-    """Generate unique order number"""
-    timestamp = datetime.now().strftime("%Y%m%d")
-    random_str = ''.join(random.choices(string.digits, k=6))
-    return f"ORD-{timestamp}-{random_str}"
-
 def format_phone_number(phone: str) -> str:
     """Format phone number for SMS"""
     phone = ''.join(filter(str.isdigit, phone))
@@ -0,0 +1,72 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence
+from fastapi import HTTPException, Response, status
+from sqlalchemy import literal, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort-key values of the last row into an opaque cursor token"""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> list:
+    """Decode a cursor token produced by encode_cursor"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("cursor size mismatch")
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def apply_keyset(query, columns: Sequence, cursor: Optional[str], descending: bool = True):
+    """Restrict query to rows strictly after cursor in (columns...) order
+
+    Uses a row-value comparison so a composite index on the same columns
+    turns deep pages into an index range scan. All columns must sort in the
+    same direction.
+    """
+    if not cursor:
+        return query
+    values = decode_cursor(cursor, len(columns))
+    keys = tuple_(*columns)
+    bounds = tuple_(*[literal(value, column.type) for column, value in zip(columns, values)])
+    return query.where(keys < bounds if descending else keys > bounds)
+
+
+def set_next_cursor(
+    response: Response,
+    items: Sequence,
+    limit: int,
+    key: Callable[[Any], tuple]
+) -> None:
+    """Expose the cursor for the page after items when the page is full"""
+    if items and len(items) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(items[-1]))
+
+
+def created_at_key(item) -> tuple:
+    """Cursor key for lists ordered by (created_at, id)"""
+    return item.created_at, item.id
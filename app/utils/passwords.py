@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+import bcrypt
+
+from app.config.settings import settings
+from app.utils.helpers import get_password_cost, get_password_hash, verify_password
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BCRYPT_ROUNDS = 12
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = MIN_BCRYPT_ROUNDS,
+    max_rounds: int = MAX_BCRYPT_ROUNDS,
+    samples: int = 3
+) -> int:
+    """Pick the highest work factor whose verify time stays within target_ms
+
+    Times a verify at ``min_rounds`` and extrapolates, since each extra round
+    doubles the cost. Blocks for a few hundred milliseconds; run it once per
+    deployment with ``python -m app.cli.calibrate_bcrypt`` and pin the result
+    in BCRYPT_ROUNDS rather than in each worker.
+    """
+    password = b"calibration-password"
+    hashed = bcrypt.hashpw(password, bcrypt.gensalt(min_rounds))
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.checkpw(password, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    base_ms = sorted(timings)[len(timings) // 2]
+
+    rounds = min_rounds
+    while rounds < max_rounds and base_ms * 2 ** (rounds + 1 - min_rounds) <= target_ms:
+        rounds += 1
+    return rounds
+
+
+class PasswordHasher:
+    """Async facade that runs bcrypt hashing/verification off the event loop.
+
+    bcrypt releases the GIL, so the default thread pool gives real parallelism;
+    a process pool can be selected with PASSWORD_HASHER_EXECUTOR=process.
+    """
+
+    def __init__(self, executor_kind: str = "thread", max_workers: int = 4, rounds: Optional[int] = None):
+        self.executor_kind = executor_kind
+        self.max_workers = max_workers
+        self.rounds = rounds or DEFAULT_BCRYPT_ROUNDS
+        self.rehashes = 0
+        self._background: set[asyncio.Task] = set()
+        self._executor: Optional[Executor] = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = {"hash": 0, "verify": 0}
+        self.total_seconds = {"hash": 0.0, "verify": 0.0}
+        self.max_seconds = {"hash": 0.0, "verify": 0.0}
+
+    @property
+    def executor(self) -> Executor:
+        """Create the pool lazily so importing this module stays cheap"""
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted jobs still waiting for a free worker"""
+        return max(self.in_flight - self.max_workers, 0)
+
+    async def _run(self, op: str, fn, *args):
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        started = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.in_flight -= 1
+            self.calls[op] += 1
+            self.total_seconds[op] += elapsed
+            self.max_seconds[op] = max(self.max_seconds[op], elapsed)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password"""
+        return await self._run("hash", get_password_hash, password, self.rounds)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a hash"""
+        return await self._run("verify", verify_password, plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a stored hash is cheaper than the configured work factor
+
+        Stronger hashes are kept, so lowering BCRYPT_ROUNDS never rehashes.
+        """
+        return get_password_cost(hashed_password) < self.rounds
+
+    def schedule_rehash(self, model, record_id: str, password: str, old_hash: str) -> None:
+        """Rehash a password at the current work factor in the background
+
+        ``model`` is any mapped class with ``id``, ``password_hash`` and
+        ``updated_at`` columns. The update only applies if the stored hash is
+        still ``old_hash``, so a concurrent password change wins.
+        """
+        task = asyncio.create_task(self._rehash(model, record_id, password, old_hash))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _rehash(self, model, record_id: str, password: str, old_hash: str) -> None:
+        from sqlalchemy import update
+        from app.config.firebase import AsyncSessionLocal
+
+        try:
+            new_hash = await self.hash(password)
+            async with AsyncSessionLocal() as session:
+                await session.execute(
+                    update(model)
+                    .where(model.id == record_id, model.password_hash == old_hash)
+                    .values(password_hash=new_hash, updated_at=model.updated_at)
+                )
+                await session.commit()
+            self.rehashes += 1
+        except Exception:
+            logger.exception("Background password rehash failed for %s %s", model.__tablename__, record_id)
+
+    def stats(self) -> dict:
+        """Return queue depth and latency counters"""
+        return {
+            "executor": self.executor_kind,
+            "max_workers": self.max_workers,
+            "rounds": self.rounds,
+            "rehashes": self.rehashes,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_in_flight": self.max_in_flight,
+            "calls": dict(self.calls),
+            "total_seconds": dict(self.total_seconds),
+            "max_seconds": dict(self.max_seconds),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor_kind=settings.PASSWORD_HASHER_EXECUTOR,
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    rounds=settings.BCRYPT_ROUNDS,
+)
+
+
+registry.callback(
+    "password_hasher_queue_depth", "Password hashing jobs waiting for a worker",
+    lambda: [((), password_hasher.queue_depth)]
+)
+registry.callback(
+    "password_hasher_in_flight", "Password hashing jobs submitted and not finished",
+    lambda: [((), password_hasher.in_flight)]
+)
+registry.callback(
+    "password_hasher_calls_total", "Completed password hashing jobs",
+    lambda: [((op,), count) for op, count in password_hasher.calls.items()],
+    labelnames=("op",), type_name="counter"
+)
+registry.callback(
+    "password_hasher_seconds_total", "Time spent in password hashing jobs, including queueing",
+    lambda: [((op,), seconds) for op, seconds in password_hasher.total_seconds.items()],
+    labelnames=("op",), type_name="counter"
+)
@@ -0,0 +1,105 @@
+"""Offline benchmark suite for the service layer.
+
+Runs service methods against a dedicated, seeded database and compares the
+results with a stored JSON baseline. BENCH_DATABASE_URL must point at a
+throwaway database: seeding truncates the application tables.
+
+Usage:
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks --seed --save
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks --threshold 0.2
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Run service-layer benchmarks")
+    parser.add_argument("--seed", action="store_true", help="Reset and seed the benchmark database first")
+    parser.add_argument("--scale", type=int, default=1, help="Dataset size multiplier for --seed")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("-k", "--filter", default=None, help="Only run cases whose name contains this")
+    parser.add_argument("--baseline", default="default", help="Baseline name under benchmarks/baselines/")
+    parser.add_argument("--save", action="store_true", help="Store results as the new baseline")
+    parser.add_argument("--output", default=None, help="Also write results to this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown (fraction)")
+    return parser.parse_args()
+
+
+async def _main(args) -> int:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+
+    from app.config.firebase import engine
+    from benchmarks import cases  # noqa: F401  registers the cases
+    from benchmarks.harness import (
+        build_report, compare, load_report, registered_cases, run_case, save_report
+    )
+    from benchmarks.seed import seed_database
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        if args.seed:
+            counts = await seed_database(engine, session_factory, scale=args.scale)
+            print("Seeded:", ", ".join(f"{name}={count}" for name, count in counts.items()))
+
+        results = {}
+        for name, fn in registered_cases().items():
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = await run_case(session_factory, fn, args.rounds, args.warmup)
+            print(f"{name:50s} median {results[name]['median_ms']:9.2f} ms   p95 {results[name]['p95_ms']:9.2f} ms")
+    finally:
+        await engine.dispose()
+
+    report = build_report(results)
+    if args.output:
+        save_report(report, Path(args.output))
+
+    baseline_path = BASELINE_DIR / f"{args.baseline}.json"
+    if args.save:
+        save_report(report, baseline_path)
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    baseline = load_report(baseline_path)
+    if baseline is None:
+        print(f"No baseline at {baseline_path}; run with --save to create one")
+        return 0
+
+    regressions = 0
+    print()
+    for row in compare(report, baseline, args.threshold):
+        if row["status"] == "new":
+            print(f"{row['name']:50s} new")
+            continue
+        print(f"{row['name']:50s} {row['baseline_ms']:9.2f} -> {row['median_ms']:9.2f} ms  {row['change']:+7.1%}  {row['status']}")
+        regressions += row["status"] == "regressed"
+
+    if regressions:
+        print(f"\n{regressions} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    args = _parse_args()
+    bench_url = os.environ.get("BENCH_DATABASE_URL")
+    if not bench_url:
+        print("BENCH_DATABASE_URL is required (seeding truncates tables)", file=sys.stderr)
+        return 2
+    # Must be set before app.config.settings is imported
+    os.environ["DATABASE_URL"] = bench_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    # The seed rebuilds order_daily_stats, so measure the rollup path
+    os.environ.setdefault("ORDER_STATS_FROM_ROLLUP", "true")
+    return asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+from contextlib import nullcontext
+from datetime import datetime
+
+from app.models.postgress_model import OrderStatus, PaymentStatus, StudentStatus
+from app.services.customer_service import CustomerService
+from app.services.expenses import ExpenseService
+from app.services.news_service import NewsService
+from app.services.order_export_service import OrderExportService
+from app.services.order_search_service import OrderSearchService
+from app.services.order_service import OrderService
+from app.services.payment_service import PaymentService
+from app.services.student_service import StudentService
+from benchmarks.harness import benchmark
+
+CURRENT_YEAR = datetime.utcnow().year
+
+
+# ========== Orders ==========
+
+@benchmark("orders.list")
+async def orders_list(db):
+    await OrderService.list_orders(db, skip=0, limit=100)
+
+
+@benchmark("orders.list_deep_page")
+async def orders_list_deep_page(db):
+    await OrderService.list_orders(db, skip=4000, limit=100)
+
+
+@benchmark("orders.list_status")
+async def orders_list_status(db):
+    await OrderService.list_orders(db, limit=100, status=OrderStatus.COMPLETED)
+
+
+@benchmark("orders.list_search")
+async def orders_list_search(db):
+    await OrderService.list_orders(db, limit=100, search="shirts")
+
+
+@benchmark("orders.search_ranked")
+async def orders_search_ranked(db):
+    await OrderSearchService.search(db, "embroidered shirts", limit=20)
+
+
+@benchmark("orders.export_csv")
+async def orders_export_csv(db):
+    async for _ in OrderExportService.export_orders("csv", session_factory=lambda: nullcontext(db)):
+        pass
+
+
+@benchmark("orders.statistics_all")
+async def orders_statistics_all(db):
+    await OrderService.get_order_statistics(db, period="all")
+
+
+@benchmark("orders.statistics_year_breakdown_comparison")
+async def orders_statistics_year(db):
+    await OrderService.get_order_statistics(
+        db, year=CURRENT_YEAR - 1, include_monthly_breakdown=True, include_comparison=True
+    )
+
+
+@benchmark("orders.statistics_range_breakdown")
+async def orders_statistics_range(db):
+    await OrderService.get_order_statistics(
+        db,
+        start_date=datetime(CURRENT_YEAR - 2, 1, 1),
+        end_date=datetime(CURRENT_YEAR, 12, 31),
+        include_monthly_breakdown=True,
+        include_comparison=True
+    )
+
+
+
+@benchmark("orders.timeseries_week")
+async def orders_timeseries_week(db):
+    await OrderService.get_order_timeseries(
+        db, granularity="week", start_date=datetime(CURRENT_YEAR - 2, 1, 1).date()
+    )
+
+# ========== Customers ==========
+
+@benchmark("customers.list")
+async def customers_list(db):
+    await CustomerService.list_customers(db, limit=100)
+
+
+@benchmark("customers.list_search")
+async def customers_list_search(db):
+    await CustomerService.list_customers(db, limit=100, search="mensah")
+
+
+@benchmark("customers.top_revenue")
+async def customers_top_revenue(db):
+    await CustomerService.list_customers(db, limit=20, sort="lifetime_revenue")
+
+
+# ========== Expenses ==========
+
+@benchmark("expenses.list")
+async def expenses_list(db):
+    await ExpenseService.get_expenses(db, limit=100)
+
+
+@benchmark("expenses.statistics_year")
+async def expenses_statistics_year(db):
+    await ExpenseService.get_expense_statistics(db, year=CURRENT_YEAR - 1)
+
+
+@benchmark("expenses.statistics_multi_year")
+async def expenses_statistics_multi_year(db):
+    for year in range(CURRENT_YEAR - 2, CURRENT_YEAR + 1):
+        await ExpenseService.get_expense_statistics(db, year=year)
+
+
+@benchmark("expenses.statistics_range")
+async def expenses_statistics_range(db):
+    await ExpenseService.get_expense_statistics(
+        db, start_date=datetime(CURRENT_YEAR - 2, 1, 1), end_date=datetime(CURRENT_YEAR, 12, 31)
+    )
+
+
+# ========== News ==========
+
+@benchmark("news.list_current")
+async def news_list_current(db):
+    await NewsService.get_all_news(db, limit=100, current_only=True)
+
+
+@benchmark("news.statistics")
+async def news_statistics(db):
+    await NewsService.get_news_statistics(db)
+
+
+# ========== Students ==========
+
+@benchmark("students.list_search")
+async def students_list_search(db):
+    await StudentService.get_students(db, limit=100, status_filter=StudentStatus.PENDING, search="student1")
+
+
+@benchmark("students.statistics")
+async def students_statistics(db):
+    await StudentService.get_admission_statistics(db)
+
+
+# ========== Payments ==========
+
+@benchmark("payments.list")
+async def payments_list(db):
+    await PaymentService.get_all_payments(db, limit=100, status_filter=PaymentStatus.SUCCESS)
+
+
+@benchmark("payments.statistics")
+async def payments_statistics(db):
+    await PaymentService.get_payment_statistics(db)
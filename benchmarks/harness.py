@@ -0,0 +1,98 @@
+import json
+import math
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+BenchmarkFn = Callable[..., Awaitable]
+
+_CASES: dict[str, BenchmarkFn] = {}
+
+
+def benchmark(name: str):
+    """Register an async benchmark case taking a database session"""
+    def decorator(fn: BenchmarkFn) -> BenchmarkFn:
+        if name in _CASES:
+            raise ValueError(f"Benchmark {name} already registered")
+        _CASES[name] = fn
+        return fn
+    return decorator
+
+
+def registered_cases() -> dict[str, BenchmarkFn]:
+    return dict(_CASES)
+
+
+def summarize(timings: list[float]) -> dict:
+    """Summary statistics in milliseconds"""
+    ordered = sorted(timings)
+    p95_index = min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)
+    return {
+        "rounds": len(ordered),
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p95_ms": ordered[p95_index] * 1000,
+        "stddev_ms": (statistics.stdev(ordered) * 1000) if len(ordered) > 1 else 0.0,
+    }
+
+
+async def run_case(session_factory, fn: BenchmarkFn, rounds: int, warmup: int) -> dict:
+    """Time one case; each round gets a fresh session so caches do not carry over"""
+    timings = []
+    for i in range(warmup + rounds):
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await fn(session)
+            elapsed = time.perf_counter() - started
+        if i >= warmup:
+            timings.append(elapsed)
+    return summarize(timings)
+
+
+def build_report(results: dict[str, dict]) -> dict:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "benchmarks": results,
+    }
+
+
+def save_report(report: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+
+def load_report(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[dict]:
+    """Return comparisons of median latency against a baseline report
+
+    A case regresses when its median is more than ``threshold`` (a fraction,
+    e.g. 0.2 for 20%) slower than the baseline median.
+    """
+    rows = []
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            rows.append({"name": name, "status": "new", "median_ms": result["median_ms"]})
+            continue
+        change = (result["median_ms"] - base["median_ms"]) / base["median_ms"] if base["median_ms"] else 0.0
+        rows.append({
+            "name": name,
+            "status": "regressed" if change > threshold else "ok",
+            "baseline_ms": base["median_ms"],
+            "median_ms": result["median_ms"],
+            "change": change,
+        })
+    return rows
@@ -0,0 +1,163 @@
+import random
+from datetime import datetime, timedelta
+
+import bcrypt
+from sqlalchemy import text
+
+from app.config.firebase import Base
+from app.models.postgress_model import (
+    Contact, Customer, Expense, ExpenseType, News, Order, OrderStatus,
+    Payment, PaymentStatus, PaymentType, Service, Student, StudentStatus
+)
+from app.services.order_search_service import OrderSearchService
+from app.services.order_stats_service import OrderStatsService
+from app.services.customer_stats_service import CustomerStatsService
+
+SEED_TABLES = "outbox, payments, students, order_daily_stats, orders, customers, services, expenses, news, contacts"
+CHUNK_SIZE = 2000
+
+
+def _random_datetime(rng: random.Random, start: datetime, end: datetime) -> datetime:
+    return start + timedelta(seconds=rng.randint(0, int((end - start).total_seconds())))
+
+
+async def seed_database(engine, session_factory, scale: int = 1, seed: int = 42) -> dict:
+    """Reset the benchmark tables and load a deterministic dataset
+
+    ``scale`` multiplies every row count; scale 1 is ~5k orders over three
+    years.
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    start = datetime(now.year - 2, 1, 1)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text(f"TRUNCATE {SEED_TABLES} CASCADE"))
+
+    counts = {
+        "services": 12,
+        "customers": 500 * scale,
+        "orders": 5000 * scale,
+        "expenses": 1500 * scale,
+        "news": 100 * scale,
+        "students": 400 * scale,
+        "payments": 1200 * scale,
+        "contacts": 300 * scale,
+    }
+    statuses = [OrderStatus.PENDING, OrderStatus.IN_PROGRESS, OrderStatus.COMPLETED, OrderStatus.CANCELLED]
+    status_weights = [15, 15, 60, 10]
+    password_hash = bcrypt.hashpw(b"benchmark", bcrypt.gensalt(4)).decode("utf-8")
+
+    services = [
+        Service(id=f"svc-{i}", title=f"Service {i}", description=f"Benchmark service {i}", icon="icon")
+        for i in range(counts["services"])
+    ]
+    customers = [
+        Customer(
+            id=f"cus-{i}",
+            name=f"Customer {i} {rng.choice(['Mensah', 'Owusu', 'Boateng', 'Asante', 'Osei'])}",
+            email=f"customer{i}@example.com",
+            phone=f"+23320{i:07d}",
+            created_at=_random_datetime(rng, start, now)
+        )
+        for i in range(counts["customers"])
+    ]
+    orders = []
+    for i in range(counts["orders"]):
+        created_at = _random_datetime(rng, start, now)
+        orders.append(Order(
+            id=f"ord-{i}",
+            order_number=f"ORD-{created_at:%Y%m%d}-B{i:07d}",
+            customer_id=rng.choice(customers).id,
+            service_id=rng.choice(services).id,
+            description=f"{rng.choice(['Embroidered', 'Printed', 'Branded'])} {rng.choice(['shirts', 'caps', 'mugs', 'banners'])}",
+            amount=round(rng.uniform(20, 2000), 2),
+            quantity=rng.randint(1, 200),
+            status=rng.choices(statuses, status_weights)[0],
+            created_at=created_at,
+            updated_at=created_at
+        ))
+    expenses = [
+        Expense(
+            date=_random_datetime(rng, start, now),
+            amount=round(rng.uniform(5, 5000), 2),
+            type=rng.choice(list(ExpenseType)),
+            description="Benchmark expense"
+        )
+        for _ in range(counts["expenses"])
+    ]
+    news = []
+    for i in range(counts["news"]):
+        from_date = _random_datetime(rng, start, now + timedelta(days=60))
+        news.append(News(
+            title=f"News {i}",
+            content="Benchmark news item",
+            active=rng.random() < 0.8,
+            from_date=from_date,
+            to_date=from_date + timedelta(days=rng.randint(1, 90))
+        ))
+    students = [
+        Student(
+            id=f"stu-{i}",
+            email=f"student{i}@example.com",
+            password_hash=password_hash,
+            full_name=f"Student {i}",
+            phone=f"+23324{i:07d}",
+            status=rng.choice(list(StudentStatus)),
+            created_at=_random_datetime(rng, start, now)
+        )
+        for i in range(counts["students"])
+    ]
+    payments = [
+        Payment(
+            student_id=rng.choice(students).id,
+            payment_reference=f"bench-ref-{i}",
+            amount=round(rng.uniform(100, 5000), 2),
+            payment_type=rng.choice(list(PaymentType)),
+            status=rng.choice(list(PaymentStatus)),
+            created_at=_random_datetime(rng, start, now)
+        )
+        for i in range(counts["payments"])
+    ]
+    contacts = [
+        Contact(
+            name=f"Contact {i}",
+            email=f"contact{i}@example.com",
+            message="Benchmark message",
+            is_read=rng.random() < 0.5,
+            created_at=_random_datetime(rng, start, now)
+        )
+        for i in range(counts["contacts"])
+    ]
+
+    # Parents before children so foreign keys resolve chunk by chunk
+    for rows in (services, customers, orders, expenses, news, students, payments, contacts):
+        for offset in range(0, len(rows), CHUNK_SIZE):
+            async with session_factory() as session:
+                session.add_all(rows[offset:offset + CHUNK_SIZE])
+                await session.commit()
+
+    # Orders were inserted directly, so build their rollup, search documents
+    # and customer aggregates
+    async with session_factory() as session:
+        await OrderStatsService.rebuild(session, start.date(), now.date() + timedelta(days=1))
+        await session.commit()
+    after_id = None
+    while True:
+        async with session_factory() as session:
+            ids = await OrderSearchService.backfill_batch(session, after_id, CHUNK_SIZE)
+            await session.commit()
+        if not ids:
+            break
+        after_id = ids[-1]
+    after_id = None
+    while True:
+        async with session_factory() as session:
+            ids = await CustomerStatsService.backfill_batch(session, after_id, CHUNK_SIZE)
+            await session.commit()
+        if not ids:
+            break
+        after_id = ids[-1]
+
+    return counts
@@ -0,0 +1,63 @@
+"""Claims-mode access tokens against Postgres: refresh and revocation."""
+import os
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.config.settings import settings
+from app.middleware.auth_middleware import get_current_user
+from app.models.user import UserRole
+from app.schemas.user import UserCreate, UserUpdate
+from app.services.auth_service import AuthService
+from app.services.refresh_token_service import RefreshTokenService
+from app.utils.cache import principal_cache, token_versions
+
+
+@pytest.fixture
+def claims_mode(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_MODE", True)
+    principal_cache.clear()
+    token_versions.clear()
+
+
+async def _principal(db, access_token: str) -> dict:
+    return await get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token), db)
+
+
+def test_refresh_issues_claims_token(run_db, claims_mode):
+    async def scenario(db):
+        created = await AuthService.create_user(db, UserCreate(
+            email="kofi@example.com", full_name="Kofi Boateng", role=UserRole.ADMIN, password="s3cret-pass"
+        ))
+        user = await AuthService.authenticate_user(db, "kofi@example.com", "s3cret-pass")
+        refresh_token = await RefreshTokenService.create(db, user.id)
+
+        owner, rotated = await RefreshTokenService.rotate(db, refresh_token)
+        access_token = AuthService.create_user_access_token(owner)
+        assert rotated != refresh_token
+
+        principal = await _principal(db, access_token)
+        assert principal == {
+            "id": created.id,
+            "email": "kofi@example.com",
+            "full_name": "Kofi Boateng",
+            "role": UserRole.ADMIN.value,
+            "is_active": True
+        }
+
+        # Updating the user revokes tokens issued before the change
+        await AuthService.update_user(db, created.id, UserUpdate(full_name="Kofi A. Boateng"))
+        with pytest.raises(HTTPException) as revoked:
+            await _principal(db, access_token)
+        assert revoked.value.status_code == 401
+
+        owner, _ = await RefreshTokenService.rotate(db, rotated)
+        principal = await _principal(db, AuthService.create_user_access_token(owner))
+        assert principal["full_name"] == "Kofi A. Boateng"
+
+    run_db(scenario)
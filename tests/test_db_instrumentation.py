@@ -0,0 +1,27 @@
+"""Statement shapes used for N+1 detection."""
+from app.config.db_instrumentation import QueryStats, statement_shape
+
+
+def test_shape_ignores_parameters_and_whitespace():
+    first = statement_shape("SELECT * FROM orders\n  WHERE id = $1")
+    second = statement_shape("SELECT * FROM orders WHERE id = $7")
+    assert first == second == "SELECT * FROM orders WHERE id = ?"
+
+
+def test_shape_collapses_in_lists_of_any_length():
+    assert statement_shape("SELECT 1 WHERE id IN ($1, $2, $3)") == statement_shape("SELECT 1 WHERE id IN ($1)")
+    assert statement_shape("SELECT 1 WHERE id IN ($1, $2)") == "SELECT 1 WHERE id IN (?)"
+
+
+def test_shape_handles_pyformat_and_qmark_params():
+    assert statement_shape("UPDATE users SET name = %(name)s WHERE id = ?") == "UPDATE users SET name = ? WHERE id = ?"
+
+
+def test_query_stats_reports_most_repeated_shape():
+    stats = QueryStats()
+    assert stats.most_repeated() == (None, 0)
+    for order_id in range(3):
+        stats.record(f"SELECT * FROM customers WHERE id = ${order_id + 1}", 0.001)
+    stats.record("SELECT * FROM orders", 0.002)
+    assert stats.count == 4
+    assert stats.most_repeated() == ("SELECT * FROM customers WHERE id = ?", 3)
@@ -0,0 +1,108 @@
+"""Order writes against Postgres: search documents and derived aggregates."""
+import os
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+from fastapi import HTTPException
+from sqlalchemy import select, text
+
+from app.config.firebase import AsyncSessionLocal
+from app.models.postgress_model import Customer, Order, Service
+from app.models.order import OrderStatus
+from app.schemas.order import OrderBulkStatusUpdate, OrderCreate, OrderUpdate
+from app.services.order_search_service import OrderSearchService
+from app.services.order_service import OrderService
+
+
+async def _customer_and_service(db):
+    customer = Customer(name="Ama Mensah", email="ama@example.com", phone="+233200000001")
+    service = Service(title="Embroidery", description="Embroidered garments", icon="needle")
+    db.add_all([customer, service])
+    await db.commit()
+    return customer.id, service.id
+
+
+def test_create_and_update_order_build_search_document(run_db):
+    async def scenario(db):
+        customer_id, service_id = await _customer_and_service(db)
+        created = await OrderService.create_order(db, OrderCreate(
+            customer_id=customer_id,
+            service_id=service_id,
+            description="Embroidered shirts",
+            amount=120.0
+        ))
+        document = await db.scalar(select(Order.search_document).where(Order.id == created.id))
+        assert document is not None
+        assert [hit.order.id for hit in await OrderSearchService.search(db, "shirts")] == [created.id]
+
+        updated = await OrderService.update_order(db, created.id, OrderUpdate(description="Printed banners"))
+        assert updated.description == "Printed banners"
+        assert [hit.order.id for hit in await OrderSearchService.search(db, "banners")] == [created.id]
+        assert await OrderSearchService.search(db, "shirts") == []
+
+    run_db(scenario)
+
+
+def test_status_changes_update_customer_aggregates(run_db):
+    async def scenario(db):
+        customer_id, service_id = await _customer_and_service(db)
+        first, second = [
+            await OrderService.create_order(db, OrderCreate(
+                customer_id=customer_id, service_id=service_id, amount=amount
+            ))
+            for amount in (100.0, 50.0)
+        ]
+
+        async def aggregates():
+            row = (await db.execute(
+                select(Customer.order_count, Customer.open_orders, Customer.lifetime_revenue, Customer.last_order_at)
+                .where(Customer.id == customer_id)
+            )).one()
+            return row.order_count, row.open_orders, row.lifetime_revenue, row.last_order_at
+
+        order_count, open_orders, revenue, last_order_at = await aggregates()
+        assert (order_count, open_orders, revenue) == (2, 2, 0.0)
+        assert last_order_at == second.created_at
+
+        await OrderService.update_order(db, first.id, OrderUpdate(status=OrderStatus.COMPLETED))
+        assert await aggregates() == (2, 1, 100.0, last_order_at)
+
+        await OrderService.update_orders_status(db, OrderBulkStatusUpdate(
+            order_ids=[first.id, second.id], status=OrderStatus.CANCELLED
+        ))
+        assert await aggregates() == (2, 0, 0.0, last_order_at)
+
+        # Deleting the latest order moves last_order_at back to the one left
+        await OrderService.update_order(db, first.id, OrderUpdate(status=OrderStatus.COMPLETED))
+        await OrderService.delete_order(db, second.id)
+        assert await aggregates() == (1, 0, 100.0, first.created_at)
+
+    run_db(scenario)
+
+
+def test_update_with_missing_service_releases_the_order(run_db):
+    async def scenario(db):
+        customer_id, service_id = await _customer_and_service(db)
+        created = await OrderService.create_order(db, OrderCreate(
+            customer_id=customer_id, service_id=service_id, amount=80.0
+        ))
+
+        with pytest.raises(HTTPException) as missing:
+            await OrderService.update_order(db, created.id, OrderUpdate(service_id="no-such-service"))
+        assert (missing.value.status_code, missing.value.detail) == (404, "Service not found")
+        assert not db.in_transaction()
+
+        with pytest.raises(HTTPException) as missing:
+            await OrderService.update_order(db, "no-such-order", OrderUpdate(amount=1.0))
+        assert (missing.value.status_code, missing.value.detail) == (404, "Order not found")
+
+        # The failed update must not leave the row locked for other sessions
+        async with AsyncSessionLocal() as other:
+            await other.execute(text("SET lock_timeout = '1s'"))
+            updated = await OrderService.update_order(other, created.id, OrderUpdate(amount=90.0))
+        assert updated.amount == 90.0
+
+    run_db(scenario)
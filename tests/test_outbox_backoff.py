@@ -0,0 +1,17 @@
+"""Outbox retry backoff."""
+import pytest
+
+from app.config.settings import settings
+from app.services.outbox_service import backoff_seconds
+
+
+@pytest.fixture
+def backoff(monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_BACKOFF_SECONDS", 10)
+    monkeypatch.setattr(settings, "OUTBOX_MAX_BACKOFF_SECONDS", 300)
+
+
+@pytest.mark.parametrize("attempts, base", [(0, 10), (1, 10), (2, 20), (3, 40), (5, 160), (6, 300), (20, 300)])
+def test_backoff_doubles_up_to_the_cap_with_jitter(backoff, attempts, base):
+    for _ in range(50):
+        assert base * 0.8 <= backoff_seconds(attempts) <= base * 1.2
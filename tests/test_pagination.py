@@ -0,0 +1,25 @@
+"""Keyset cursor encoding."""
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_datetimes_and_ids():
+    created_at = datetime(2025, 3, 14, 15, 9, 26, 535897)
+    token = encode_cursor(created_at, "ord-42")
+    assert "=" not in token
+    assert decode_cursor(token, 2) == [created_at, "ord-42"]
+
+
+def test_cursor_keeps_plain_values():
+    assert decode_cursor(encode_cursor(120.5, None, "abc"), 3) == [120.5, None, "abc"]
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor!", encode_cursor("only-one"), encode_cursor({"a": 1})[:-2], ""])
+def test_invalid_cursor_is_rejected(token):
+    with pytest.raises(HTTPException) as rejected:
+        decode_cursor(token, 2)
+    assert rejected.value.status_code == 400
@@ -0,0 +1,102 @@
+"""Single-flight result cache."""
+import asyncio
+
+import pytest
+
+from app.utils.cache import ResultCache
+
+
+class Computation:
+    """Counts calls and finishes when released"""
+
+    def __init__(self, result="value"):
+        self.result = result
+        self.calls = 0
+        self.release = None
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def run(scenario):
+    return asyncio.run(scenario())
+
+
+def test_concurrent_misses_share_one_computation():
+    async def scenario():
+        cache = ResultCache(maxsize=8, ttl=60)
+        compute = Computation()
+        compute.release = asyncio.Event()
+        callers = [
+            asyncio.create_task(cache.get_or_compute("stats", {"year": 2025}, ("orders",), compute))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        compute.release.set()
+        assert await asyncio.gather(*callers) == ["value"] * 5
+        assert compute.calls == 1
+        assert await cache.get_or_compute("stats", {"year": 2025}, ("orders",), compute) == "value"
+        assert (cache.misses, cache.coalesced, cache.hits) == (1, 4, 1)
+
+    run(scenario)
+
+
+def test_first_caller_cancelling_does_not_cancel_waiters():
+    async def scenario():
+        cache = ResultCache(maxsize=8, ttl=60)
+        compute = Computation()
+        compute.release = asyncio.Event()
+        first = asyncio.create_task(cache.get_or_compute("stats", {}, ("orders",), compute))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_compute("stats", {}, ("orders",), compute))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        compute.release.set()
+        assert await second == "value"
+        assert first.cancelled()
+        assert compute.calls == 1
+
+    run(scenario)
+
+
+def test_errors_reach_every_caller_and_are_not_cached():
+    async def scenario():
+        cache = ResultCache(maxsize=8, ttl=60)
+        compute = Computation(result=RuntimeError("database down"))
+        compute.release = asyncio.Event()
+        callers = [asyncio.create_task(cache.get_or_compute("stats", {}, (), compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        compute.release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        compute.result = "recovered"
+        assert await cache.get_or_compute("stats", {}, (), compute) == "recovered"
+        assert compute.calls == 2
+
+    run(scenario)
+
+
+def test_invalidation_during_computation_skips_storing():
+    async def scenario():
+        cache = ResultCache(maxsize=8, ttl=60)
+        compute = Computation()
+        compute.release = asyncio.Event()
+        caller = asyncio.create_task(cache.get_or_compute("stats", {}, ("orders",), compute))
+        await asyncio.sleep(0)
+        cache.invalidate("orders")
+        compute.release.set()
+        assert await caller == "value"
+        assert cache.stats()["size"] == 0
+
+    run(scenario)
+
+
+@pytest.mark.parametrize("params", [{"year": 2025, "month": None}, {"month": None, "year": 2025}])
+def test_key_ignores_order_and_unset_filters(params):
+    assert ResultCache.make_key("stats", params) == ResultCache.make_key("stats", {"year": 2025})